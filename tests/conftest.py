@@ -0,0 +1,43 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+import torch
+from whisper.model import ModelDimensions, Whisper
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# A few-layer model with the real vocabulary and audio context, so that
+# tokenizers, timestamps and 30 s windows behave as with released weights
+TINY_DIMS = dict(
+    n_mels=80, n_audio_ctx=1500, n_audio_state=64, n_audio_head=2, n_audio_layer=2,
+    n_vocab=51865, n_text_ctx=448, n_text_state=64, n_text_head=2, n_text_layer=2,
+)
+
+
+@pytest.fixture
+def make_model():
+    """Build a random-weight Whisper model (no checkpoint download)"""
+    def make(seed=0, **dims):
+        torch.manual_seed(seed)
+        model = Whisper(ModelDimensions(**{**TINY_DIMS, **dims}))
+        with torch.no_grad():
+            for parameter in model.parameters():
+                parameter.normal_(0, 0.02)  # Varied logits, unlike the default init
+        return model.eval()
+    return make
+
+
+@pytest.fixture
+def speech_like():
+    """Build a deterministic 16 kHz test signal of tones in noise"""
+    def make(seconds, seed=0):
+        rng = np.random.default_rng(seed)
+        t = np.arange(int(seconds * 16000)) / 16000
+        audio = 0.01 * rng.standard_normal(len(t))
+        for start in range(0, int(seconds), 3):
+            burst = (t >= start) & (t < start + 1.5)
+            audio[burst] += 0.3 * np.sin(2 * np.pi * (200 + 40 * start) * t[burst])
+        return audio.astype(np.float32)
+    return make
@@ -0,0 +1,134 @@
+import pytest
+import torch
+import whisper
+
+from whisper_gui import DEFAULT_PROFILE, BatchedTranscriber, profile_options
+
+N_FRAMES = whisper.audio.N_FRAMES
+OPTIONS = {"task": "transcribe", "language": "en", "temperature": 0.0, "fp16": False}
+
+
+@pytest.fixture
+def model(make_model):
+    return make_model(seed=0)
+
+
+@pytest.fixture
+def recordings(speech_like):
+    return [speech_like(seconds, seed=seed) for seed, seconds in enumerate((75, 20, 41))]
+
+
+def spectrogram(audio):
+    return whisper.log_mel_spectrogram(audio, 80, padding=whisper.audio.N_SAMPLES)
+
+
+def timed_text(segments):
+    return [(round(seg["start"], 2), round(seg["end"], 2), seg["text"]) for seg in segments]
+
+
+@pytest.mark.parametrize("batch_size", [1, 2, 4])
+def test_transcribe_matches_whisper(model, recordings, batch_size):
+    engine = BatchedTranscriber(model, batch_size, dict(OPTIONS))
+    with torch.no_grad():
+        results = engine.transcribe([spectrogram(audio) for audio in recordings])
+    
+    for audio, result in zip(recordings, results):
+        expected = whisper.transcribe(
+            model, audio, condition_on_previous_text=False, verbose=None, **OPTIONS
+        )
+        assert timed_text(result["segments"]) == timed_text(expected["segments"])
+        assert result["text"] == expected["text"]
+        assert result["language"] == "en"
+    assert engine.windows >= len(recordings)
+
+
+def test_independent_windows_do_not_depend_on_batching(model, recordings):
+    mels = [spectrogram(audio) for audio in recordings]
+    with torch.no_grad():
+        single = BatchedTranscriber(model, 1, dict(OPTIONS)).transcribe_independent(mels)
+        batched = BatchedTranscriber(model, 8, dict(OPTIONS))
+        results = batched.transcribe_independent(mels)
+    
+    assert [timed_text(r["segments"]) for r in results] == [timed_text(r["segments"]) for r in single]
+    # Every fixed 30 s window of every recording goes through one pass
+    assert batched.windows == 3 + 1 + 2
+    assert batched.batches == 1
+
+
+def test_independent_windows_are_fixed(model, recordings):
+    mels = [spectrogram(audio) for audio in recordings]
+    with torch.no_grad():
+        results = BatchedTranscriber(model, 4, dict(OPTIONS)).transcribe_independent(mels)
+    
+    for audio, mel, result in zip(recordings, mels, results):
+        duration = len(audio) / whisper.audio.SAMPLE_RATE
+        for seg in result["segments"]:
+            window_start = (seg["start"] // whisper.audio.CHUNK_LENGTH) * whisper.audio.CHUNK_LENGTH
+            assert seg["start"] < seg["end"] <= min(window_start + whisper.audio.CHUNK_LENGTH, duration) + 0.01
+        
+        # Each window holds text from decoding that window alone, in order
+        # (segments timed past the window's end are dropped)
+        for seek in range(0, mel.shape[-1] - N_FRAMES, N_FRAMES):
+            window = whisper.pad_or_trim(mel[:, seek:seek + N_FRAMES], N_FRAMES)
+            with torch.no_grad():
+                alone = whisper.decode(model, window, whisper.DecodingOptions(**OPTIONS))
+            start = seek * whisper.audio.HOP_LENGTH / whisper.audio.SAMPLE_RATE
+            position = 0
+            for seg in result["segments"]:
+                if start <= seg["start"] < start + whisper.audio.CHUNK_LENGTH:
+                    position = alone.text.index(seg["text"].strip(), position)
+
+
+def test_independent_skips_windows_without_speech(model, recordings):
+    mels = [spectrogram(audio) for audio in recordings[:1]]
+    engine = BatchedTranscriber(model, 4, dict(OPTIONS))
+    with torch.no_grad():
+        results = engine.transcribe_independent(mels, speech=[[(35.0, 50.0)]])
+    
+    assert engine.windows == 1
+    assert all(30.0 <= seg["start"] < 60.0 for seg in results[0]["segments"])
+
+
+def test_beam_search_matches_whisper(model, recordings):
+    options = dict(OPTIONS, beam_size=2)
+    engine = BatchedTranscriber(model, 4, options)
+    with torch.no_grad():
+        results = engine.transcribe([spectrogram(audio) for audio in recordings[:2]])
+    
+    for audio, result in zip(recordings, results):
+        expected = whisper.transcribe(
+            model, audio, condition_on_previous_text=False, verbose=None, **options
+        )
+        assert timed_text(result["segments"]) == timed_text(expected["segments"])
+
+
+@pytest.mark.parametrize("independent", [False, True])
+def test_fallback_with_beams_and_samples(model, recordings, independent):
+    # Random weights fail the log-probability check, so every window falls
+    # back to best-of-3 sampling together with the rest of its batch
+    options = dict(OPTIONS, temperature=(0.0, 0.5), beam_size=2, best_of=3)
+    engine = BatchedTranscriber(model, 4, options)
+    mels = [spectrogram(audio) for audio in recordings[:2]]
+    torch.manual_seed(0)
+    with torch.no_grad():
+        run = engine.transcribe_independent if independent else engine.transcribe
+        results = run(mels)
+    
+    assert len(results) == 2
+    assert engine.fallbacks >= 2
+    assert all(result["fallbacks"] >= 1 for result in results)
+
+
+def test_independent_long_file_with_default_profile(model, recordings):
+    # All three windows of one file share a batch, and fall back together
+    decoding, max_fallbacks = profile_options(DEFAULT_PROFILE)
+    decoding.pop("word_timestamps", None)
+    options = dict(OPTIONS, **decoding, max_fallbacks=max_fallbacks)
+    engine = BatchedTranscriber(model, 16, options)
+    torch.manual_seed(0)
+    with torch.no_grad():
+        result, = engine.transcribe_independent([spectrogram(recordings[0])])
+    
+    assert engine.windows == 3
+    assert 3 <= result["fallbacks"] <= max_fallbacks
+    assert result["segments"] and result["segments"][-1]["end"] <= 75.0
@@ -0,0 +1,79 @@
+import dataclasses
+
+import pytest
+import torch
+import whisper
+
+from whisper_gui import SpeculativeDecoder, _SliceRecorder
+
+OPTIONS = whisper.DecodingOptions(language="en", temperature=0.0, sample_len=32, fp16=False)
+
+
+@pytest.fixture
+def mel(speech_like):
+    return whisper.log_mel_spectrogram(speech_like(20), 80, padding=whisper.audio.N_SAMPLES)
+
+
+def speculative_decode(model, draft, mel, options, lookahead=4):
+    recorder = _SliceRecorder(mel)
+    window = recorder[:, 0:whisper.audio.N_FRAMES]
+    decoder = SpeculativeDecoder(model, draft, mel, recorder, lookahead=lookahead)
+    with torch.no_grad():
+        return decoder.decode(window, options), decoder
+
+
+def greedy_decode(model, mel, options):
+    with torch.no_grad():
+        return whisper.decode(model, mel[:, :whisper.audio.N_FRAMES], options)
+
+
+@pytest.mark.parametrize("draft_seed", [0, 1])
+def test_output_matches_greedy(make_model, mel, draft_seed):
+    model = make_model(seed=0)
+    draft = make_model(seed=draft_seed)  # Seed 0: the draft is always right
+    expected = greedy_decode(model, mel, OPTIONS)
+    result, decoder = speculative_decode(model, draft, mel, OPTIONS)
+    
+    assert result.tokens == expected.tokens
+    assert result.text == expected.text
+    assert result.avg_logprob == pytest.approx(expected.avg_logprob, abs=1e-4)
+    assert decoder.passes > 0
+    if draft_seed == 0:
+        # Proposals past the end of the sequence are never verified
+        assert decoder.accepted >= decoder.proposed - 4
+        assert decoder.passes < decoder.tokens / 2
+    else:
+        assert decoder.accepted < decoder.proposed  # Rejections were corrected
+
+
+def test_output_matches_greedy_without_timestamps(make_model, mel):
+    model, draft = make_model(seed=0), make_model(seed=2)
+    options = dataclasses.replace(OPTIONS, without_timestamps=True)
+    result, _ = speculative_decode(model, draft, mel, options)
+    assert result.tokens == greedy_decode(model, mel, options).tokens
+
+
+def test_vocabularies_mapped_by_token_name(make_model, mel):
+    # large-v3 and turbo have one more language, shifting every special token
+    model = make_model(seed=0, n_vocab=51866)
+    draft = make_model(seed=0)
+    result, decoder = speculative_decode(model, draft, mel, OPTIONS)
+    assert result.tokens == greedy_decode(model, mel, OPTIONS).tokens
+    assert decoder.passes > 0
+
+
+def test_language_missing_from_draft_falls_back(make_model, mel):
+    model = make_model(seed=0, n_vocab=51866)
+    draft = make_model(seed=0)
+    options = dataclasses.replace(OPTIONS, language="yue")  # Only in 100-language vocabularies
+    result, decoder = speculative_decode(model, draft, mel, options)
+    assert result.tokens == greedy_decode(model, mel, options).tokens
+    assert decoder.passes == 0
+
+
+def test_sampling_and_beam_search_use_regular_decoder(make_model, mel):
+    model, draft = make_model(seed=0), make_model(seed=1)
+    options = dataclasses.replace(OPTIONS, beam_size=2)
+    result, decoder = speculative_decode(model, draft, mel, options)
+    assert result.tokens == greedy_decode(model, mel, options).tokens
+    assert decoder.passes == 0
@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+import soundfile as sf
+import torch
+import whisper
+
+from whisper_gui import AudioLoader, StreamingMel
+
+N_FRAMES = whisper.audio.N_FRAMES
+
+
+@pytest.fixture
+def loader(tmp_path):
+    return AudioLoader(cache_dir=str(tmp_path / "pcm"), cache_max_mb=0)
+
+
+@pytest.fixture
+def wav_16k(tmp_path, speech_like):
+    path = tmp_path / "mono16k.wav"
+    sf.write(path, speech_like(75), 16000, subtype="PCM_16")
+    return str(path)
+
+
+@pytest.fixture
+def flac_stereo_44k(tmp_path, speech_like):
+    path = tmp_path / "stereo44k.flac"
+    seconds = 75 * 44100 / 16000  # speech_like() counts 16 kHz samples
+    left, right = speech_like(seconds, seed=1), speech_like(seconds, seed=2)
+    sf.write(path, np.stack([left, 0.5 * right], axis=1), 44100)
+    return str(path)
+
+
+def reference_mel(loader, path, n_mels=80):
+    audio = loader.load(path)["audio"]
+    return whisper.log_mel_spectrogram(audio, n_mels, padding=whisper.audio.N_SAMPLES)
+
+
+def seeks(frames):
+    """Windows as whisper.transcribe slices them, including the padded tail"""
+    return [0, 1234, N_FRAMES, frames - N_FRAMES - 700, frames - N_FRAMES, frames - 10]
+
+
+@pytest.mark.parametrize("source", ["wav_16k", "flac_stereo_44k"])
+@pytest.mark.parametrize("n_mels", [80, 128])
+def test_windows_match_full_spectrogram(request, loader, source, n_mels):
+    path = request.getfixturevalue(source)
+    expected = reference_mel(loader, path, n_mels)
+    stream = StreamingMel(lambda: loader.stream(path, block_seconds=7), n_mels, chunk_frames=1000)
+    
+    assert stream.shape == tuple(expected.shape)
+    assert stream.num_samples == len(loader.load(path)["audio"])
+    for seek in seeks(expected.shape[1]):
+        window = stream[:, seek:seek + N_FRAMES]
+        torch.testing.assert_close(window, expected[:, seek:seek + N_FRAMES], atol=2e-4, rtol=0)
+
+
+def test_tail_window_is_padding(loader, wav_16k):
+    # The last N_SAMPLES of the spectrogram cover the zero padding whisper adds
+    expected = reference_mel(loader, wav_16k)
+    stream = StreamingMel(lambda: loader.stream(wav_16k), 80)
+    frames = expected.shape[1]
+    tail = stream[:, frames - N_FRAMES // 2:frames + N_FRAMES]
+    
+    assert tail.shape == (80, N_FRAMES // 2)
+    torch.testing.assert_close(tail, expected[:, frames - N_FRAMES // 2:], atol=2e-4, rtol=0)
+    assert torch.allclose(tail[:, -100:], tail[:, -100:].min())  # Clamped silence
+
+
+def test_seeking_backwards_restarts_stream(loader, wav_16k):
+    expected = reference_mel(loader, wav_16k)
+    stream = StreamingMel(lambda: loader.stream(wav_16k), 80)
+    late = stream[:, 2 * N_FRAMES:3 * N_FRAMES]
+    early = stream[:, 100:100 + N_FRAMES]
+    torch.testing.assert_close(late, expected[:, 2 * N_FRAMES:3 * N_FRAMES], atol=2e-4, rtol=0)
+    torch.testing.assert_close(early, expected[:, 100:100 + N_FRAMES], atol=2e-4, rtol=0)
@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+
+import whisper_gui
+from whisper_gui import detect_speech
+
+SR = 16000
+
+
+def noise(seconds, amplitude, seed=0):
+    rng = np.random.default_rng(seed)
+    return (amplitude * rng.standard_normal(int(seconds * SR))).astype(np.float32)
+
+
+def tone(seconds, amplitude=0.3, freq=440.0):
+    t = np.arange(int(seconds * SR)) / SR
+    return (amplitude * np.sin(2 * np.pi * freq * t)).astype(np.float32)
+
+
+def test_empty_and_zero_audio_is_silence():
+    assert detect_speech(np.zeros(0, dtype=np.float32)) == []
+    assert detect_speech(np.zeros(60 * SR, dtype=np.float32)) == []
+
+
+@pytest.mark.parametrize("amplitude", [0.0005, 0.002])
+def test_noise_below_floor_is_silence(amplitude):
+    audio = noise(60, amplitude)
+    rms_db = 20 * np.log10(np.sqrt(np.mean(audio ** 2)))
+    assert rms_db < whisper_gui.VAD_FLOOR_DB
+    assert detect_speech(audio) == []
+
+
+def test_tone_in_noise_is_found():
+    audio = noise(60, 0.002)
+    audio[20 * SR:30 * SR] += tone(10)
+    regions = detect_speech(audio)
+    assert len(regions) == 1
+    start, end = regions[0]
+    assert start == pytest.approx(20 - whisper_gui.VAD_PAD, abs=0.1)
+    assert end == pytest.approx(30 + whisper_gui.VAD_PAD, abs=0.1)
+
+
+def test_short_gaps_are_bridged():
+    audio = noise(60, 0.0005)
+    audio[10 * SR:15 * SR] += tone(5)
+    audio[16 * SR:20 * SR] += tone(4)  # 1 s gap < VAD_MIN_SILENCE
+    audio[40 * SR:45 * SR] += tone(5)
+    regions = detect_speech(audio)
+    assert len(regions) == 2
+    assert regions[0][0] < 10 < 20 < regions[0][1] < 40
@@ -5,32 +5,2747 @@ A free and open source GUI for local Whisper transcription on Fedora
 Supports single/batch file upload, microphone recording, and multiple languages
 """
 
+import time
+
+_MODULE_START = time.perf_counter()
+
+import argparse
+import ctypes
+import gc
+import hashlib
+import importlib
+import json
+import multiprocessing
 import os
+import queue
+import subprocess
 import tempfile
 import threading
-import time
+import types
+import warnings
+from collections import OrderedDict
+from contextlib import contextmanager
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
-from pathlib import Path
 
-import gradio as gr
-import whisper
-import torch
-import numpy as np
-from scipy.io import wavfile
-import librosa
-from tqdm import tqdm
+# Seconds spent importing each heavy dependency, filled in as they are first used
+IMPORT_TIMES = {}
+
+
+class _LazyModule:
+    """Module proxy that imports the real module on first attribute access
+    
+    Heavy dependencies (torch, whisper, gradio, ...) take seconds to import.
+    Deferring them keeps startup fast and lets code paths that never touch a
+    dependency avoid paying for it at all.
+    """
+    
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+    
+    def _load(self):
+        """Import the wrapped module, recording how long it took"""
+        if self._module is None:
+            start_time = time.perf_counter()
+            module = importlib.import_module(self._name)
+            IMPORT_TIMES.setdefault(self._name, time.perf_counter() - start_time)
+            self._module = module
+        return self._module
+    
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+    
+    def __repr__(self):
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<lazy module '{self._name}' ({state})>"
+
+
+gr = _LazyModule("gradio")
+whisper = _LazyModule("whisper")
+torch = _LazyModule("torch")
+np = _LazyModule("numpy")
+wavfile = _LazyModule("scipy.io.wavfile")
+librosa = _LazyModule("librosa")
+sf = _LazyModule("soundfile")
+
+_LAZY_MODULES = [gr, whisper, torch, np, wavfile, librosa, sf]
+
+
+def preload_modules():
+    """Import all deferred dependencies immediately"""
+    for module in _LAZY_MODULES:
+        module._load()
+
+
+def import_time_report():
+    """Summarize measured import times
+    
+    Returns:
+        str: Multi-line report of per-module import times
+    """
+    lines = ["Import times:"]
+    for name, seconds in sorted(IMPORT_TIMES.items(), key=lambda item: -item[1]):
+        lines.append(f"  {name:<20} {seconds:6.2f}s")
+    pending = [module._name for module in _LAZY_MODULES if module._module is None]
+    if pending:
+        lines.append(f"  not imported yet: {', '.join(pending)}")
+    lines.append(f"  total since start    {time.perf_counter() - _MODULE_START:6.2f}s")
+    return "\n".join(lines)
+
+# Compute modes selectable in the UI, mapped to the weight dtype used as cache key
+COMPUTE_MODES = {
+    "Standard": "float32",
+    "Quantized CPU (int8)": "int8",
+}
+
+# Inference backends selectable in the UI. ONNX Runtime runs as the "onnx"
+# compute mode, so its models are loaded, cached and leased like the others
+BACKENDS = {
+    "PyTorch": None,
+    "ONNX Runtime (CPU)": "onnx",
+}
+
+def _cache_home():
+    """Base cache directory, following XDG_CACHE_HOME like whisper does"""
+    return os.getenv("XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache"))
+
+
+# Directory whisper downloads its checkpoints to
+WHISPER_DOWNLOAD_ROOT = os.path.join(_cache_home(), "whisper")
+
+# Record of checkpoints whose SHA256 has already been verified
+VERIFY_CACHE_FILE = os.path.join(WHISPER_DOWNLOAD_ROOT, "verified.json")
+
+# Memory-mappable weight store (disable with WHISPER_MMAP_WEIGHTS=0)
+MMAP_WEIGHTS = os.getenv("WHISPER_MMAP_WEIGHTS", "1") != "0"
+MMAP_STORE_DIR = os.getenv("WHISPER_MMAP_STORE", os.path.join(WHISPER_DOWNLOAD_ROOT, "mmap"))
+
+# Run a short synthetic clip through each freshly loaded model (disable with WHISPER_WARMUP=0)
+WARMUP_MODELS = os.getenv("WHISPER_WARMUP", "1") != "0"
+
+# Number of requests Gradio processes at once (override with WHISPER_CONCURRENCY)
+DEFAULT_CONCURRENCY = int(os.getenv("WHISPER_CONCURRENCY", "4"))
+
+# Model replicas in worker processes: 0 disables the pool, "auto" calibrates
+DEFAULT_REPLICAS = os.getenv("WHISPER_REPLICAS", "0")
+
+# torch threads per replica (0 splits the available cores evenly)
+DEFAULT_THREADS_PER_REPLICA = int(os.getenv("WHISPER_THREADS_PER_REPLICA", "0"))
+
+# Unload models unused for this many seconds (0 keeps them loaded forever)
+DEFAULT_IDLE_TIMEOUT = float(os.getenv("WHISPER_IDLE_TIMEOUT", "1800"))
+
+# Decoded-audio cache: directory and size cap in megabytes (0 disables it)
+PCM_CACHE_DIR = os.getenv("WHISPER_PCM_CACHE_DIR", os.path.join(_cache_home(), "near-whisper", "pcm"))
+PCM_CACHE_MB = float(os.getenv("WHISPER_PCM_CACHE_MB", "2048"))
+
+# Exported ONNX graphs for the ONNX Runtime backend, one directory per model
+ONNX_EXPORT_DIR = os.getenv("WHISPER_ONNX_DIR", os.path.join(_cache_home(), "near-whisper", "onnx"))
+ONNX_GRAPHS = ("encoder", "cross_kv", "decoder")
+
+# In-memory log-mel spectrogram cache size in megabytes (0 disables it)
+MEL_CACHE_MB = float(os.getenv("WHISPER_MEL_CACHE_MB", "512"))
+
+# Voice activity detection: frames quieter than the noise floor plus this
+# margin (and anything at or below VAD_FLOOR_DB dBFS) count as silence, and only
+# silences of at least VAD_MIN_SILENCE seconds are skipped
+VAD_MARGIN_DB = float(os.getenv("WHISPER_VAD_MARGIN_DB", "12"))
+VAD_FLOOR_DB = -50.0
+VAD_MIN_SILENCE = float(os.getenv("WHISPER_VAD_MIN_SILENCE", "2.0"))
+VAD_PAD = 0.3
+
+# Batch pipeline: files decoded and featurized ahead of the one being
+# transcribed (0 disables prefetching), and threads doing that work
+DEFAULT_PREFETCH_DEPTH = int(os.getenv("WHISPER_PREFETCH_DEPTH", "2"))
+DEFAULT_PREFETCH_WORKERS = int(os.getenv("WHISPER_PREFETCH_WORKERS", "2"))
+
+# Parallel long-file mode: target chunk length in seconds, audio shared by
+# neighbouring chunks, and worker processes when no replica pool is
+# configured (0 = one per four cores)
+DEFAULT_CHUNK_SECONDS = float(os.getenv("WHISPER_CHUNK_SECONDS", "300"))
+CHUNK_OVERLAP = 1.0
+DEFAULT_CHUNK_WORKERS = int(os.getenv("WHISPER_CHUNK_WORKERS", "0"))
+
+# Batched inference: 30 s windows per encoder/decoder batch by model size
+# (WHISPER_BATCH_SIZE overrides it for every model)
+BATCH_SIZES = {"tiny": 16, "base": 16, "small": 8, "medium": 4, "large": 2, "turbo": 4}
+BATCH_SIZE_OVERRIDE = int(os.getenv("WHISPER_BATCH_SIZE", "0"))
+
+# Speculative decoding: draft models, and tokens the draft proposes per
+# verification pass of the large model
+SPECULATIVE_DRAFTS = ["tiny", "base"]
+SPECULATIVE_LOOKAHEAD = int(os.getenv("WHISPER_SPECULATIVE_LOOKAHEAD", "6"))
+
+# Decoding settings traded off between speed and accuracy. whisper re-decodes
+# a window at the next temperature when its output looks repetitive or
+# unlikely; max_fallbacks bounds how many such re-decodes one file may take
+# (None = unbounded, as in whisper.transcribe)
+PERFORMANCE_PROFILES = {
+    "fastest": {
+        "beam_size": None,
+        "best_of": 1,
+        "temperature": (0.0, 0.8),
+        "max_fallbacks": 2,
+        "word_timestamps": False,
+    },
+    "balanced": {
+        "beam_size": None,
+        "best_of": 5,
+        "temperature": (0.0, 0.4, 0.8),
+        "max_fallbacks": 8,
+        "word_timestamps": False,
+    },
+    "accurate": {
+        "beam_size": 5,
+        "best_of": 5,
+        "temperature": (0.0, 0.2, 0.4, 0.6, 0.8, 1.0),
+        "max_fallbacks": None,
+        "word_timestamps": True,
+    },
+}
+DEFAULT_PROFILE = "balanced"
+
+# Small model that identifies the language for larger ones in auto-detect
+# mode ("" lets every model detect the language itself)
+LANGUAGE_ID_MODEL = os.getenv("WHISPER_LANGUAGE_ID_MODEL", "tiny")
+LANGUAGE_ID_CACHE_SIZE = 4096
+
+# Memory budget for loaded models, in megabytes (override with WHISPER_MODEL_CACHE_MB)
+DEFAULT_MODEL_CACHE_MB = float(os.getenv("WHISPER_MODEL_CACHE_MB", "4096"))
+
+
+def _model_nbytes(model):
+    """Estimate the resident size of a model's weights
+    
+    Args:
+        model (torch.nn.Module): Loaded model
+        
+    Returns:
+        int: Size of all parameters and buffers in bytes
+    """
+    if isinstance(model, OnnxWhisper):
+        return model.nbytes
+    
+    total = 0
+    for tensor in list(model.parameters()) + list(model.buffers()):
+        total += tensor.numel() * tensor.element_size()
+    
+    # Dynamically quantized layers keep their weights in packed params
+    for module in model.modules():
+        if type(module).__name__ == "LinearPackedParams":
+            for tensor in module._weight_bias():
+                if tensor is not None:
+                    total += tensor.numel() * tensor.element_size()
+    return total
+
+
+def _process_rss():
+    """Resident set size of this process in bytes, or None if unavailable"""
+    try:
+        with open("/proc/self/statm", "r") as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def reclaim_memory():
+    """Release memory freed by unloaded models back to the OS"""
+    gc.collect()
+    if torch.cuda.is_available():
+        torch.cuda.empty_cache()
+    
+    # glibc keeps freed heap memory around; ask it to return what it can
+    try:
+        ctypes.CDLL("libc.so.6").malloc_trim(0)
+    except (OSError, AttributeError):
+        pass
+
+
+def _time_encoder(model, repeats=1):
+    """Measure the encoder forward time on a silent 30-second window
+    
+    Args:
+        model (whisper.model.Whisper): Loaded model
+        repeats (int): Number of timed passes
+        
+    Returns:
+        float: Mean seconds per encoder pass
+    """
+    mel = torch.zeros(1, model.dims.n_mels, whisper.audio.N_FRAMES, device=model.device)
+    with torch.no_grad():
+        start_time = time.perf_counter()
+        for _ in range(repeats):
+            model.encoder(mel)
+    return (time.perf_counter() - start_time) / repeats
+
+
+def warm_up_model(model, fp16=False):
+    """Run a short synthetic clip through the encoder and decoder
+    
+    The first inference after a load pays for allocator growth, kernel
+    selection and loading the mel filterbank. Doing it here moves that cost
+    out of the first user request.
+    
+    Args:
+        model (whisper.model.Whisper): Loaded model
+        fp16 (bool): Decode in half precision (GPU only)
+        
+    Returns:
+        float: Seconds spent warming up
+    """
+    start_time = time.perf_counter()
+    
+    # Two seconds of a quiet tone over low noise, padded to one window
+    sample_rate = whisper.audio.SAMPLE_RATE
+    t = np.arange(2 * sample_rate, dtype=np.float32) / sample_rate
+    rng = np.random.default_rng(0)
+    clip = 0.05 * np.sin(2 * np.pi * 220 * t) + 0.005 * rng.standard_normal(t.shape)
+    clip = whisper.pad_or_trim(clip.astype(np.float32))
+    
+    mel = whisper.log_mel_spectrogram(clip, model.dims.n_mels, device=model.device)
+    options = whisper.DecodingOptions(fp16=fp16, sample_len=8)
+    whisper.decode(model, mel, options)
+    
+    return time.perf_counter() - start_time
+
+
+def quantize_model_int8(model):
+    """Apply dynamic int8 quantization to the Linear layers of a Whisper model
+    
+    The model is quantized in place and must live on the CPU. The size of the
+    weights and the encoder latency are measured before and after.
+    
+    Args:
+        model (whisper.model.Whisper): fp32 model on the CPU
+        
+    Returns:
+        tuple: (quantized_model, report) where report is a dict with the
+            fp32/int8 weight sizes and encoder times
+    """
+    report = {
+        "fp32_bytes": _model_nbytes(model),
+        "fp32_encoder_s": _time_encoder(model),
+    }
+    
+    # whisper's Linear subclass only adds a dtype cast in forward(); turn it
+    # back into a plain nn.Linear so the quantizer recognizes and swaps it
+    for module in model.modules():
+        if type(module) is whisper.model.Linear:
+            module.__class__ = torch.nn.Linear
+    
+    model = torch.ao.quantization.quantize_dynamic(
+        model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True
+    )
+    
+    report["int8_bytes"] = _model_nbytes(model)
+    report["int8_encoder_s"] = _time_encoder(model)
+    return model, report
+
+
+def onnx_model_dir(model_name):
+    """Directory holding the exported ONNX graphs of a model"""
+    return os.path.join(ONNX_EXPORT_DIR, model_name)
+
+
+def export_onnx(model_name, model=None, output_dir=None):
+    """Export a Whisper model to ONNX for the ONNX Runtime backend
+    
+    Three graphs are written, each to its own subdirectory (graphs of the
+    large models exceed protobuf's 2 GB limit and keep their weights in
+    external files next to them):
+    
+    - encoder: log-mel spectrogram to audio features
+    - cross_kv: audio features to the cross-attention keys and values of
+      every decoder layer, computed once per window
+    - decoder: new tokens plus the self-attention cache to logits and the
+      extended cache
+    
+    model.json is written last and marks a complete export.
+    
+    Args:
+        model_name (str): Name of the model
+        model (whisper.model.Whisper): fp32 model on the CPU (loaded when None)
+        output_dir (str): Target directory (defaults to onnx_model_dir())
+        
+    Returns:
+        str: Directory holding the exported model
+    """
+    if model is None:
+        model = whisper.load_model(model_name, device="cpu", download_root=WHISPER_DOWNLOAD_ROOT)
+    model = model.float().eval()
+    output_dir = output_dir or onnx_model_dir(model_name)
+    dims = model.dims
+    decoder = model.decoder
+    
+    class CrossKV(torch.nn.Module):
+        def __init__(self):
+            super().__init__()
+            self.blocks = decoder.blocks
+        
+        def forward(self, audio_features):
+            keys = [block.cross_attn.key(audio_features) for block in self.blocks]
+            values = [block.cross_attn.value(audio_features) for block in self.blocks]
+            return torch.stack(keys), torch.stack(values)
+    
+    class DecoderStep(torch.nn.Module):
+        def __init__(self):
+            super().__init__()
+            self.decoder = decoder
+        
+        def forward(self, tokens, self_keys, self_values, cross_keys, cross_values):
+            offset = self_keys.shape[2]
+            x = decoder.token_embedding(tokens) + decoder.positional_embedding[offset:offset + tokens.shape[-1]]
+            new_keys, new_values = [], []
+            for i, block in enumerate(decoder.blocks):
+                h = block.attn_ln(x)
+                k = torch.cat([self_keys[i], block.attn.key(h)], dim=1)
+                v = torch.cat([self_values[i], block.attn.value(h)], dim=1)
+                new_keys.append(k)
+                new_values.append(v)
+                x = x + block.attn.out(block.attn.qkv_attention(block.attn.query(h), k, v, decoder.mask)[0])
+                h = block.cross_attn_ln(x)
+                x = x + block.cross_attn.out(
+                    block.cross_attn.qkv_attention(block.cross_attn.query(h), cross_keys[i], cross_values[i])[0]
+                )
+                x = x + block.mlp(block.mlp_ln(x))
+            x = decoder.ln(x)
+            logits = torch.nn.functional.linear(x, decoder.token_embedding.weight)
+            return logits, torch.stack(new_keys), torch.stack(new_values)
+    
+    layers, state = dims.n_text_layer, dims.n_text_state
+    mel = torch.zeros(1, dims.n_mels, whisper.audio.N_FRAMES)
+    audio_features = torch.zeros(1, dims.n_audio_ctx, dims.n_audio_state)
+    cache = torch.zeros(layers, 1, 1, state)  # One cached token keeps the length symbolic
+    cross = torch.zeros(layers, 1, dims.n_audio_ctx, state)
+    graphs = {
+        "encoder": (model.encoder, (mel,), ["mel"], ["audio_features"], {
+            "mel": {0: "batch"}, "audio_features": {0: "batch"},
+        }),
+        "cross_kv": (CrossKV(), (audio_features,), ["audio_features"], ["cross_keys", "cross_values"], {
+            "audio_features": {0: "batch"}, "cross_keys": {1: "batch"}, "cross_values": {1: "batch"},
+        }),
+        "decoder": (
+            DecoderStep(),
+            (torch.zeros(1, 1, dtype=torch.long), cache, cache, cross, cross),
+            ["tokens", "self_keys", "self_values", "cross_keys", "cross_values"],
+            ["logits", "new_self_keys", "new_self_values"],
+            {
+                "tokens": {0: "batch", 1: "tokens"},
+                "self_keys": {1: "batch", 2: "cached"},
+                "self_values": {1: "batch", 2: "cached"},
+                "cross_keys": {1: "batch"},
+                "cross_values": {1: "batch"},
+                "logits": {0: "batch", 1: "tokens"},
+                "new_self_keys": {1: "batch", 2: "length"},
+                "new_self_values": {1: "batch", 2: "length"},
+            },
+        ),
+    }
+    
+    # The exporter traces the explicit attention; SDPA does not export cleanly
+    with torch.no_grad(), whisper.model.disable_sdpa(), warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        for graph, (module, args, input_names, output_names, dynamic_axes) in graphs.items():
+            graph_dir = os.path.join(output_dir, graph)
+            os.makedirs(graph_dir, exist_ok=True)
+            torch.onnx.export(
+                module, args, os.path.join(graph_dir, "model.onnx"),
+                input_names=input_names, output_names=output_names, dynamic_axes=dynamic_axes,
+                opset_version=17, dynamo=False,
+            )
+    
+    with open(os.path.join(output_dir, "model.json"), "w") as f:
+        json.dump({"name": model_name, "dims": dims.__dict__}, f, indent=2)
+    return output_dir
+
+
+class _OnnxTextDecoder:
+    """Text decoder of an OnnxWhisper, called like whisper's TextDecoder
+    
+    whisper's PyTorchInference stores the kv-cache in a dict keyed by the
+    key and value projections of each block's self-attention and reorders
+    it by those keys for beam search. This decoder offers the same keys
+    (as plain placeholders) and keeps each layer's cached keys and values
+    under them, plus the cross-attention keys and values under a key of
+    its own.
+    """
+    
+    def __init__(self, model):
+        """Initialize the decoder
+        
+        Args:
+            model (OnnxWhisper): Model the decoder belongs to
+        """
+        self.session = model.sessions["decoder"]
+        self.cross_session = model.sessions["cross_kv"]
+        self.n_state = model.dims.n_text_state
+        self.blocks = [
+            types.SimpleNamespace(attn=types.SimpleNamespace(key=object(), value=object()))
+            for _ in range(model.dims.n_text_layer)
+        ]
+        self._cross = object()
+    
+    def __call__(self, tokens, audio_features, kv_cache=None):
+        """Logits for tokens, reusing and extending kv_cache when given"""
+        cache = kv_cache if kv_cache is not None else {}
+        cross = cache.get(self._cross)
+        if cross is None:
+            cross = self.cross_session.run(None, {"audio_features": audio_features.float().cpu().numpy()})
+            cache[self._cross] = cross
+        
+        first = self.blocks[0].attn.key
+        if first in cache:
+            keys = np.stack([cache[block.attn.key].numpy() for block in self.blocks])
+            values = np.stack([cache[block.attn.value].numpy() for block in self.blocks])
+        else:
+            keys = values = np.zeros((len(self.blocks), tokens.shape[0], 0, self.n_state), dtype=np.float32)
+        
+        logits, keys, values = self.session.run(None, {
+            "tokens": tokens.cpu().numpy().astype(np.int64),
+            "self_keys": keys,
+            "self_values": values,
+            "cross_keys": cross[0],
+            "cross_values": cross[1],
+        })
+        for i, block in enumerate(self.blocks):
+            cache[block.attn.key] = torch.from_numpy(keys[i])
+            cache[block.attn.value] = torch.from_numpy(values[i])
+        return torch.from_numpy(logits)
+
+
+class OnnxWhisper:
+    """Whisper model whose encoder and decoder run on ONNX Runtime
+    
+    Offers the parts of whisper.model.Whisper that whisper's decoding and
+    transcribe() use, so it is leased, wrapped and transcribed with like a
+    PyTorch model. Only CPU fp32 inference is supported. Word-level
+    timestamps need the attention weights of the PyTorch model and are
+    turned off.
+    """
+    
+    def __init__(self, model_dir, threads=None):
+        """Open the exported graphs of a model
+        
+        Args:
+            model_dir (str): Directory written by export_onnx()
+            threads (int): Intra-op threads (defaults to torch's setting, so
+                replicas keep their share of the cores)
+        """
+        ort = importlib.import_module("onnxruntime")
+        with open(os.path.join(model_dir, "model.json"), "r") as f:
+            meta = json.load(f)
+        self.name = meta["name"]
+        self.dims = whisper.model.ModelDimensions(**meta["dims"])
+        self.device = torch.device("cpu")
+        
+        options = ort.SessionOptions()
+        options.intra_op_num_threads = threads or torch.get_num_threads()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        self.sessions = {
+            graph: ort.InferenceSession(
+                os.path.join(model_dir, graph, "model.onnx"), options, providers=["CPUExecutionProvider"]
+            )
+            for graph in ONNX_GRAPHS
+        }
+        self.nbytes = sum(
+            entry.stat().st_size
+            for graph in ONNX_GRAPHS
+            for entry in os.scandir(os.path.join(model_dir, graph))
+        )
+        self.decoder = _OnnxTextDecoder(self)
+    
+    @property
+    def is_multilingual(self):
+        return self.dims.n_vocab >= 51865
+    
+    @property
+    def num_languages(self):
+        return self.dims.n_vocab - 51765 - int(self.is_multilingual)
+    
+    def encoder(self, mel):
+        """Audio features for a batch of log-mel spectrograms"""
+        features = self.sessions["encoder"].run(None, {"mel": mel.float().cpu().numpy()})[0]
+        return torch.from_numpy(features)
+    
+    def embed_audio(self, mel):
+        return self.encoder(mel)
+    
+    def logits(self, tokens, audio_features):
+        return self.decoder(tokens, audio_features)
+    
+    def install_kv_cache_hooks(self, cache=None):
+        """The decoder fills the cache itself, so no hooks are needed"""
+        return ({**cache} if cache is not None else {}), []
+    
+    def detect_language(self, mel, tokenizer=None):
+        return whisper.decoding.detect_language(self, mel, tokenizer)
+    
+    def decode(self, mel, options=None, **kwargs):
+        return whisper.decoding.decode(self, mel, options or whisper.DecodingOptions(), **kwargs)
+    
+    def transcribe(self, audio, **kwargs):
+        if kwargs.get("word_timestamps"):
+            warnings.warn("Word timestamps are not supported by the ONNX Runtime backend")
+            kwargs["word_timestamps"] = False
+        return importlib.import_module("whisper.transcribe").transcribe(self, audio, **kwargs)
+
+
+def backend_label(compute_mode):
+    """Name of the inference backend used for a compute mode"""
+    return "ONNX Runtime (CPU)" if compute_mode == "onnx" else "PyTorch"
+
+
+def _format_bytes(num_bytes):
+    """Format a byte count as a short human readable string"""
+    size = float(num_bytes)
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+def _sha256_file(path, chunk_size=1024 * 1024):
+    """Compute the SHA256 of a file without reading it into memory at once"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class CheckpointVerifier:
+    """Remembers which downloaded checkpoints already passed their SHA256 check
+    
+    whisper.load_model() re-reads and hashes the whole checkpoint on every
+    load, which is gigabytes of I/O for the large models. A verified file is
+    recorded together with its size, mtime and inode; as long as none of those
+    change, the file is trusted without hashing it again.
+    """
+    
+    def __init__(self, cache_file=VERIFY_CACHE_FILE, download_root=WHISPER_DOWNLOAD_ROOT):
+        """Initialize the verifier
+        
+        Args:
+            cache_file (str): JSON file holding the verification records
+            download_root (str): Directory whisper downloads checkpoints to
+        """
+        self.cache_file = cache_file
+        self.download_root = download_root
+        self._lock = threading.Lock()
+        self._records = self._read_records()
+        
+        # Statistics
+        self.hashed = 0
+        self.skipped = 0
+    
+    def _read_records(self):
+        """Load verification records from disk"""
+        try:
+            with open(self.cache_file, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def _write_records(self):
+        """Persist verification records (lock held)"""
+        try:
+            os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+            temp_path = f"{self.cache_file}.{os.getpid()}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(self._records, f, indent=2)
+            os.replace(temp_path, self.cache_file)
+        except OSError as e:
+            print(f"Could not save checkpoint verification cache: {e}")
+    
+    @staticmethod
+    def _fingerprint(path):
+        """File identity used to decide whether a past verification still holds"""
+        stat = os.stat(path)
+        return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "inode": stat.st_ino}
+    
+    def _record(self, path, sha256):
+        """Remember that a file matched its expected hash"""
+        with self._lock:
+            self._records[path] = dict(self._fingerprint(path), sha256=sha256)
+            self._write_records()
+    
+    def _forget(self, path):
+        """Drop the record for a file"""
+        with self._lock:
+            if self._records.pop(path, None) is not None:
+                self._write_records()
+    
+    def _is_verified(self, path, expected_sha256):
+        """Check whether a file has a still-valid verification record"""
+        with self._lock:
+            record = self._records.get(path)
+        if record is None or record.get("sha256") != expected_sha256:
+            return False
+        try:
+            fingerprint = self._fingerprint(path)
+        except OSError:
+            return False
+        return all(record.get(field) == value for field, value in fingerprint.items())
+    
+    def checkpoint_path(self, model_name):
+        """Return the path of a verified checkpoint, downloading it if needed
+        
+        Args:
+            model_name (str): Name of an official Whisper model
+            
+        Returns:
+            str: Path to the checkpoint file
+        """
+        url = whisper._MODELS[model_name]
+        expected_sha256 = url.split("/")[-2]
+        path = os.path.join(self.download_root, os.path.basename(url))
+        
+        if os.path.isfile(path):
+            if self._is_verified(path, expected_sha256):
+                self.skipped += 1
+                return path
+            
+            self.hashed += 1
+            if _sha256_file(path) == expected_sha256:
+                self._record(path, expected_sha256)
+                return path
+            self._forget(path)
+        
+        # Missing or corrupt: let whisper (re-)download it, which verifies the result
+        path = whisper._download(url, self.download_root, False)
+        self._record(path, expected_sha256)
+        return path
+    
+    def verify(self, model_names):
+        """Re-hash downloaded checkpoints regardless of cached records
+        
+        Args:
+            model_names (list): Names of official Whisper models
+            
+        Returns:
+            list: One status line per model
+        """
+        report = []
+        for model_name in model_names:
+            url = whisper._MODELS.get(model_name)
+            if url is None:
+                report.append(f"❌ {model_name}: unknown model")
+                continue
+            
+            expected_sha256 = url.split("/")[-2]
+            path = os.path.join(self.download_root, os.path.basename(url))
+            if not os.path.isfile(path):
+                report.append(f"ℹ️ {model_name}: not downloaded")
+                continue
+            
+            self.hashed += 1
+            if _sha256_file(path) == expected_sha256:
+                self._record(path, expected_sha256)
+                report.append(f"✅ {model_name}: checksum OK")
+            else:
+                self._forget(path)
+                report.append(f"❌ {model_name}: checksum mismatch, will re-download on next load")
+        return report
+
+
+class MmapWeightStore:
+    """Local store of Whisper checkpoints in a memory-mappable format
+    
+    Official checkpoints hold fp16 weights that whisper copies into freshly
+    allocated fp32 parameters, so every process pays for a private copy. The
+    store converts each checkpoint once into fp32 tensors saved with
+    torch.save, then loads them with torch.load(mmap=True) and assigns the
+    mapped tensors directly as model parameters. Pages come from the OS page
+    cache, so processes on one host share a single copy of the weights and a
+    reload after a restart only maps the file.
+    """
+    
+    def __init__(self, verifier, root=MMAP_STORE_DIR):
+        """Initialize the store
+        
+        Args:
+            verifier (CheckpointVerifier): Provides verified original checkpoints
+            root (str): Directory holding the converted checkpoints
+        """
+        self.verifier = verifier
+        self.root = root
+    
+    def path_for(self, model_name):
+        """Path of the converted checkpoint for a model"""
+        return os.path.join(self.root, f"{model_name}.pt")
+    
+    def supports(self, model_name):
+        """Whether the model is an official checkpoint the store can convert"""
+        return model_name in whisper._MODELS
+    
+    def convert(self, model_name):
+        """Convert a model's official checkpoint into the store
+        
+        Args:
+            model_name (str): Name of an official Whisper model
+            
+        Returns:
+            str: Path to the converted checkpoint
+        """
+        checkpoint_file = self.verifier.checkpoint_path(model_name)
+        checkpoint = torch.load(checkpoint_file, map_location="cpu", weights_only=True)
+        state_dict = {
+            name: (tensor.float() if tensor.is_floating_point() else tensor).contiguous()
+            for name, tensor in checkpoint["model_state_dict"].items()
+        }
+        
+        # Write to a temporary file first so concurrent processes never map a partial file
+        os.makedirs(self.root, exist_ok=True)
+        path = self.path_for(model_name)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        torch.save({"dims": checkpoint["dims"], "model_state_dict": state_dict}, temp_path)
+        os.replace(temp_path, path)
+        return path
+    
+    def load(self, model_name, device="cpu"):
+        """Load a model with memory-mapped weights, converting it on first use
+        
+        Args:
+            model_name (str): Name of an official Whisper model
+            device (str): Device to place the model on; anything other than
+                the CPU copies the weights out of the mapping
+            
+        Returns:
+            whisper.model.Whisper: Loaded model
+        """
+        path = self.path_for(model_name)
+        if not os.path.isfile(path):
+            print(f"Converting '{model_name}' checkpoint to memory-mappable format...")
+            self.convert(model_name)
+        
+        checkpoint = torch.load(path, mmap=True, map_location="cpu", weights_only=True)
+        dims = whisper.model.ModelDimensions(**checkpoint["dims"])
+        
+        # Build the modules on the meta device so no weights are allocated,
+        # then assign the mapped tensors as parameters. Whisper.__init__ can't
+        # run on meta (it creates a sparse buffer), so assemble it by hand.
+        with torch.device("meta"):
+            encoder = whisper.model.AudioEncoder(
+                dims.n_mels, dims.n_audio_ctx, dims.n_audio_state, dims.n_audio_head, dims.n_audio_layer
+            )
+            decoder = whisper.model.TextDecoder(
+                dims.n_vocab, dims.n_text_ctx, dims.n_text_state, dims.n_text_head, dims.n_text_layer
+            )
+        model = whisper.model.Whisper.__new__(whisper.model.Whisper)
+        torch.nn.Module.__init__(model)
+        model.dims = dims
+        model.encoder = encoder
+        model.decoder = decoder
+        model.load_state_dict(checkpoint["model_state_dict"], assign=True)
+        
+        # Non-persistent buffers are not in the checkpoint; rebuild them
+        mask = torch.empty(dims.n_text_ctx, dims.n_text_ctx).fill_(-np.inf).triu_(1)
+        model.decoder.register_buffer("mask", mask, persistent=False)
+        model.set_alignment_heads(whisper._ALIGNMENT_HEADS[model_name])
+        
+        return model.to(device)
+
+
+class AudioLoader:
+    """Decodes audio files in-process to 16 kHz mono float32 arrays
+    
+    whisper's own loader spawns an ffmpeg subprocess per file, which for
+    batches of short clips costs more than the inference itself. Formats
+    libsndfile understands (WAV, FLAC, OGG, MP3, ...) are decoded with
+    soundfile and resampled with librosa; anything else falls back to
+    whisper's ffmpeg loader.
+    
+    WAV files that are already 16 kHz mono PCM (microphone recordings, for
+    example) skip decoding altogether: they are memory-mapped, and int16
+    samples are scaled to float32 in a single vectorized pass.
+    
+    Decoded audio is also kept in a content-addressed disk cache: files are
+    identified by the SHA256 of their bytes and their PCM is stored as .npy,
+    so re-transcribing an upload (with another model or language) opens the
+    cached samples memory-mapped instead of decoding again. The cache is
+    capped in size and evicts the least recently used entries.
+    """
+    
+    def __init__(self, sample_rate=16000, cache_dir=PCM_CACHE_DIR, cache_max_mb=PCM_CACHE_MB):
+        """Initialize the loader
+        
+        Args:
+            sample_rate (int): Output sample rate
+            cache_dir (str): Directory for cached PCM
+            cache_max_mb (float): Size cap of the cache in megabytes (0 disables it)
+        """
+        self.sample_rate = sample_rate
+        self.cache_dir = cache_dir
+        self.cache_max_bytes = int(cache_max_mb * 1024 * 1024)
+        self._lock = threading.Lock()
+        self._hash_memo = {}
+        
+        # Statistics
+        self.decoder_counts = {"wav": 0, "soundfile": 0, "ffmpeg": 0}
+        self.decode_seconds = 0.0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.cache_bytes_saved = 0
+    
+    def file_hash(self, audio_path):
+        """SHA256 of a file's content, memoized while the file is unchanged
+        
+        Args:
+            audio_path (str): Path to the file
+            
+        Returns:
+            str: Hex digest
+        """
+        stat = os.stat(audio_path)
+        identity = (os.path.abspath(audio_path), stat.st_size, stat.st_mtime_ns, stat.st_ino)
+        with self._lock:
+            digest = self._hash_memo.get(identity)
+        if digest is None:
+            digest = _sha256_file(audio_path)
+            with self._lock:
+                self._hash_memo[identity] = digest
+        return digest
+    
+    def _cache_path(self, audio_hash):
+        """Location of the cached PCM for a file hash"""
+        return os.path.join(self.cache_dir, f"{audio_hash}_{self.sample_rate}.npy")
+    
+    def _cache_read(self, audio_hash):
+        """Open cached PCM memory-mapped, or return None on a miss"""
+        path = self._cache_path(audio_hash)
+        try:
+            # Copy-on-write mapping: zero-copy, yet writable for torch.from_numpy
+            audio = np.load(path, mmap_mode="c")
+            os.utime(path)  # Mark as recently used for LRU eviction
+            return audio
+        except (OSError, ValueError):
+            return None
+    
+    def _cache_write(self, audio_hash, audio):
+        """Store decoded PCM and evict old entries beyond the size cap"""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            path = self._cache_path(audio_hash)
+            temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(temp_path, "wb") as f:
+                np.save(f, audio)
+            os.replace(temp_path, path)
+            self._cache_evict()
+        except OSError as e:
+            print(f"PCM cache write error: {e}")
+    
+    def _cache_evict(self):
+        """Remove least recently used entries until the cache fits its cap"""
+        entries = []
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.endswith(".npy"):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.cache_max_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+    
+    def _read_wav_fast(self, audio_path):
+        """Map a WAV file whose samples are already in the target format
+        
+        Args:
+            audio_path (str): Path to the audio file
+            
+        Returns:
+            np.ndarray: float32 samples, or None if the file needs decoding
+        """
+        data = self._map_wav(audio_path)
+        return None if data is None else self._wav_to_float32(data)
+    
+    def _map_wav(self, audio_path):
+        """Memory-map the raw samples of a fast-path WAV file
+        
+        Returns:
+            np.ndarray: float32 or int16 mono samples at the target rate, or
+                None if the file needs decoding
+        """
+        with open(audio_path, "rb") as f:
+            header = f.read(12)
+        if header[:4] not in (b"RIFF", b"RF64") or header[8:12] != b"WAVE":
+            return None
+        
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", wavfile.WavFileWarning)  # e.g. "fact" chunks
+                sample_rate, data = wavfile.read(audio_path, mmap=True)
+        except (ValueError, OSError):
+            return None  # Compressed or unusual sample formats
+        if sample_rate != self.sample_rate or data.ndim != 1 or data.dtype not in (np.float32, np.int16):
+            return None
+        return data
+    
+    @staticmethod
+    def _wav_to_float32(data):
+        """float32 samples from (part of) a _map_wav() mapping"""
+        if data.dtype == np.float32:
+            return data  # Copy-on-write mapping of the file itself
+        # Exact: 1 / 32768 is a power of two
+        return np.multiply(data, np.float32(1 / 32768), dtype=np.float32)
+    
+    def _decode_soundfile(self, audio_path):
+        """Decode with libsndfile and resample to the target rate"""
+        data, sample_rate = sf.read(audio_path, dtype="float32", always_2d=True)
+        audio = data.mean(axis=1) if data.shape[1] > 1 else data[:, 0]
+        if sample_rate != self.sample_rate:
+            audio = librosa.resample(audio, orig_sr=sample_rate, target_sr=self.sample_rate)
+        return np.ascontiguousarray(audio, dtype=np.float32)
+    
+    def _decode(self, audio_path):
+        """Decode a file, preferring soundfile over ffmpeg
+        
+        Returns:
+            tuple: (audio, decoder_name)
+        """
+        try:
+            return self._decode_soundfile(audio_path), "soundfile"
+        except sf.SoundFileError:
+            # Containers libsndfile can't read (MP4/M4A, WebM, ...)
+            return whisper.load_audio(audio_path, sr=self.sample_rate), "ffmpeg"
+    
+    def stream(self, audio_path, block_seconds=30):
+        """Decode an audio file incrementally
+        
+        Only one block is held in memory at a time, so this is suitable for
+        recordings too long to decode into a single array. soundfile blocks
+        are resampled with a streaming soxr resampler (which gives the same
+        samples as the one-shot librosa path); other containers are read from
+        an ffmpeg pipe, matching whisper's loader.
+        
+        Args:
+            audio_path (str): Path to the audio file
+            block_seconds (float): Approximate length of each block
+            
+        Yields:
+            np.ndarray: Consecutive 16 kHz mono float32 blocks
+        """
+        try:
+            sound_file = sf.SoundFile(audio_path)
+        except sf.SoundFileError:
+            yield from self._stream_ffmpeg(audio_path, block_seconds)
+            return
+        
+        with sound_file:
+            resampler = None
+            if sound_file.samplerate != self.sample_rate:
+                soxr = importlib.import_module("soxr")
+                resampler = soxr.ResampleStream(
+                    sound_file.samplerate, self.sample_rate, 1, dtype="float32", quality="HQ"
+                )
+            
+            block_frames = int(block_seconds * sound_file.samplerate)
+            while True:
+                data = sound_file.read(block_frames, dtype="float32", always_2d=True)
+                last = len(data) < block_frames
+                block = data.mean(axis=1) if data.shape[1] > 1 else data[:, 0]
+                if resampler is not None:
+                    block = resampler.resample_chunk(np.ascontiguousarray(block), last=last)
+                if len(block):
+                    yield np.ascontiguousarray(block, dtype=np.float32)
+                if last:
+                    break
+    
+    def _stream_ffmpeg(self, audio_path, block_seconds):
+        """Decode through an ffmpeg pipe, one block at a time"""
+        cmd = [
+            "ffmpeg", "-nostdin", "-threads", "0", "-i", audio_path,
+            "-f", "s16le", "-ac", "1", "-acodec", "pcm_s16le", "-ar", str(self.sample_rate), "-",
+        ]
+        block_bytes = int(block_seconds * self.sample_rate) * 2
+        process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        try:
+            while True:
+                data = process.stdout.read(block_bytes)
+                if not data:
+                    break
+                yield np.frombuffer(data, np.int16).astype(np.float32) / 32768.0
+        finally:
+            process.stdout.close()
+            process.kill()
+            process.wait()
+        if process.returncode not in (0, -9):
+            raise RuntimeError(f"ffmpeg failed to decode {audio_path}")
+    
+    def load(self, audio_path):
+        """Decode an audio file, using the PCM cache when possible
+        
+        Args:
+            audio_path (str): Path to the audio file
+            
+        Returns:
+            dict: "audio" (float32 array), "hash" (content SHA256),
+                "decoder" (decoder used, or "cache"), "cache_hit" and
+                "decode_s" (seconds spent hashing, reading and decoding)
+        """
+        start_time = time.perf_counter()
+        audio_hash = self.file_hash(audio_path)
+        
+        # Already in the target format: nothing to decode or cache
+        audio = self._read_wav_fast(audio_path)
+        cache_hit = False
+        if audio is not None:
+            decoder = "wav"
+        else:
+            audio = self._cache_read(audio_hash) if self.cache_max_bytes > 0 else None
+            cache_hit = audio is not None
+            if cache_hit:
+                decoder = "cache"
+            else:
+                audio, decoder = self._decode(audio_path)
+                if self.cache_max_bytes > 0:
+                    self._cache_write(audio_hash, audio)
+        decode_s = time.perf_counter() - start_time
+        
+        with self._lock:
+            if cache_hit:
+                self.cache_hits += 1
+                self.cache_bytes_saved += audio.nbytes
+            else:
+                if decoder != "wav":
+                    self.cache_misses += 1
+                self.decoder_counts[decoder] += 1
+            self.decode_seconds += decode_s
+        return {
+            "audio": audio,
+            "hash": audio_hash,
+            "decoder": decoder,
+            "cache_hit": cache_hit,
+            "decode_s": decode_s,
+        }
+    
+    def fast_path_summary(self):
+        """Describe how often the WAV fast path was taken
+        
+        Returns:
+            str: Status line for display
+        """
+        with self._lock:
+            fast = self.decoder_counts["wav"]
+            total = fast + self.cache_hits + self.cache_misses
+            return f"WAV fast path {fast}/{total} files"
+    
+    def cache_summary(self):
+        """Describe PCM cache effectiveness
+        
+        Returns:
+            str: Status line for display
+        """
+        with self._lock:
+            lookups = self.cache_hits + self.cache_misses
+            hit_rate = self.cache_hits / lookups if lookups else 0.0
+            return (
+                f"hit rate {hit_rate:.0%} ({self.cache_hits}/{lookups}), "
+                f"{_format_bytes(self.cache_bytes_saved)} of PCM not re-decoded"
+            )
+
+
+def detect_speech(audio, sample_rate=16000, min_silence=VAD_MIN_SILENCE, margin_db=VAD_MARGIN_DB):
+    """Find the speech regions of a recording with an energy-based VAD
+    
+    Frame energy is compared with an adaptive threshold above the noise floor
+    (the 10th percentile of frame energy). Regions are padded by VAD_PAD
+    seconds and gaps shorter than min_silence are bridged: every separate
+    region costs whisper at least one 30 s encoder pass, so only long
+    silences are worth skipping.
+    
+    Args:
+        audio (np.ndarray): 16 kHz mono float32 samples
+        sample_rate (int): Sample rate of the audio
+        min_silence (float): Shortest silence to skip, in seconds
+        margin_db (float): Threshold above the noise floor, in dB
+        
+    Returns:
+        list: (start, end) tuples in seconds
+    """
+    hop = sample_rate // 100
+    rms = librosa.feature.rms(y=audio, frame_length=4 * hop, hop_length=hop, center=True)[0]
+    if len(audio) == 0 or rms.max() <= 0:
+        return []
+    
+    energy_db = 20 * np.log10(np.maximum(rms, 1e-10))
+    if energy_db.max() <= VAD_FLOOR_DB:
+        return []  # Nothing louder than the floor: the whole file is silence
+    
+    threshold = np.percentile(energy_db, 10) + margin_db
+    threshold = min(threshold, energy_db.max() - 1.0)  # Never call the loudest frame silence
+    threshold = max(threshold, VAD_FLOOR_DB)  # ...unless it is below the absolute floor
+    active = energy_db > threshold
+    
+    # Rising and falling edges of the active frames
+    edges = np.flatnonzero(np.diff(np.concatenate([[0], active.astype(np.int8), [0]])))
+    duration = len(audio) / sample_rate
+    regions = []
+    for start_frame, end_frame in zip(edges[::2].tolist(), edges[1::2].tolist()):
+        start = max(start_frame * hop / sample_rate - VAD_PAD, 0.0)
+        end = min(end_frame * hop / sample_rate + VAD_PAD, duration)
+        if regions and start - regions[-1][1] < min_silence:
+            regions[-1] = (regions[-1][0], end)
+        else:
+            regions.append((start, end))
+    return regions
+
+
+def split_at_silence(audio, sample_rate=16000, chunk_seconds=DEFAULT_CHUNK_SECONDS):
+    """Split a recording into chunks of about chunk_seconds at quiet points
+    
+    Each cut is placed at the quietest half second within 10% of the target
+    length (at most 15 s) either side, so chunks rarely start mid-word.
+    
+    Args:
+        audio (np.ndarray): 16 kHz mono float32 samples
+        sample_rate (int): Sample rate of the audio
+        chunk_seconds (float): Target chunk length
+        
+    Returns:
+        list: (start, end) sample ranges covering the audio without overlap
+    """
+    chunk = int(chunk_seconds * sample_rate)
+    search = int(min(chunk_seconds * 0.1, 15.0) * sample_rate)
+    hop = sample_rate // 100
+    smoothing = np.ones(50) / 50  # Half a second of frames
+    
+    boundaries = [0]
+    while len(audio) - boundaries[-1] > chunk + search:
+        low = boundaries[-1] + chunk - search
+        rms = librosa.feature.rms(y=audio[low:low + 2 * search], frame_length=4 * hop, hop_length=hop, center=False)[0]
+        quietest = int(np.argmin(np.convolve(rms, smoothing, mode="valid"))) + len(smoothing) // 2
+        boundaries.append(low + quietest * hop + 2 * hop)
+    boundaries.append(len(audio))
+    return list(zip(boundaries[:-1], boundaries[1:]))
+
+
+def _encoder_windows(seconds):
+    """Number of 30 s windows whisper needs for the given length of audio"""
+    return -(-int(round(seconds * 100)) // whisper.audio.N_FRAMES)
+
+
+# Per-thread log-mel spectrogram handed to whisper.transcribe by precomputed_mel()
+_mel_override = threading.local()
+
+
+def _install_mel_hook():
+    """Let whisper.transcribe use a precomputed log-mel spectrogram
+    
+    whisper.transcribe() always computes the spectrogram itself. This wraps
+    the log_mel_spectrogram it calls so that, inside precomputed_mel(), a
+    matching spectrogram set by the current thread is returned instead.
+    Other threads and calls outside the context are unaffected.
+    """
+    module = importlib.import_module("whisper.transcribe")
+    if getattr(module.log_mel_spectrogram, "_uses_mel_override", False):
+        return
+    original = module.log_mel_spectrogram
+    
+    def log_mel_spectrogram(audio, n_mels=80, padding=0, device=None):
+        mel = getattr(_mel_override, "mel", None)
+        if (
+            mel is not None
+            and device is None
+            and mel.shape[0] == n_mels
+            and not isinstance(audio, str)
+            and mel.shape[-1] == (audio.shape[-1] + padding) // whisper.audio.HOP_LENGTH
+        ):
+            return mel
+        return original(audio, n_mels, padding, device)
+    
+    log_mel_spectrogram._uses_mel_override = True
+    module.log_mel_spectrogram = log_mel_spectrogram
+
+
+@contextmanager
+def precomputed_mel(mel):
+    """Make whisper.transcribe() in this thread reuse a log-mel spectrogram
+    
+    Args:
+        mel (torch.Tensor): Spectrogram computed with padding=N_SAMPLES, or
+            None to compute it as usual
+    """
+    _install_mel_hook()
+    _mel_override.mel = mel
+    try:
+        yield
+    finally:
+        _mel_override.mel = None
+
+
+class MelCache:
+    """LRU cache of log-mel spectrograms keyed by (audio hash, n_mels)
+    
+    The spectrogram depends only on the audio and the number of mel bins (80
+    for tiny through large-v2, 128 for large-v3 and turbo), so comparing
+    models or re-running with a forced language can reuse it.
+    """
+    
+    def __init__(self, max_mb=MEL_CACHE_MB):
+        """Initialize an empty cache
+        
+        Args:
+            max_mb (float): Size cap in megabytes (0 disables caching)
+        """
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+        self.seconds_saved = 0.0
+    
+    def get(self, audio_hash, audio, n_mels):
+        """Return the spectrogram whisper.transcribe would compute for the audio
+        
+        Args:
+            audio_hash (str): Content hash identifying the audio
+            audio (np.ndarray): 16 kHz mono float32 samples
+            n_mels (int): Number of mel bins of the model
+            
+        Returns:
+            tuple: (mel, cache_hit)
+        """
+        key = (audio_hash, n_mels)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                self.seconds_saved += entry["compute_s"]
+                return entry["mel"], True
+        
+        start_time = time.perf_counter()
+        mel = whisper.log_mel_spectrogram(audio, n_mels, padding=whisper.audio.N_SAMPLES)
+        compute_s = time.perf_counter() - start_time
+        size = mel.numel() * mel.element_size()
+        
+        with self._lock:
+            self.misses += 1
+            if size <= self.max_bytes:
+                self._entries[key] = {"mel": mel, "size": size, "compute_s": compute_s}
+                total = sum(entry["size"] for entry in self._entries.values())
+                while total > self.max_bytes:
+                    _, evicted = self._entries.popitem(last=False)
+                    total -= evicted["size"]
+        return mel, False
+    
+    def summary(self):
+        """Describe mel cache effectiveness
+        
+        Returns:
+            str: Status line for display
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            hit_rate = self.hits / lookups if lookups else 0.0
+            return (
+                f"hit rate {hit_rate:.0%} ({self.hits}/{lookups}), "
+                f"{self.seconds_saved:.2f}s of spectrogram computation saved"
+            )
+
+
+class _PaddedSignal:
+    """Sliding view over a decode stream, padded the way whisper pads audio
+    
+    whisper computes its spectrogram over audio + N_SAMPLES of silence, with
+    torch.stft reflect-padding N_FFT // 2 samples at each end. This exposes
+    that padded signal for reads whose start never moves backwards, keeping
+    only the samples still needed in memory.
+    """
+    
+    def __init__(self, blocks):
+        """Initialize the view
+        
+        Args:
+            blocks (iterator): Yields consecutive float32 audio blocks
+        """
+        self._blocks = iter(blocks)
+        self._buffer = np.zeros(0, dtype=np.float32)
+        self.offset = 0  # Padded-signal index of self._buffer[0]
+        self._started = False
+        self.exhausted = False
+        self.num_samples = 0  # Real audio samples decoded so far
+        self.peak_buffer_bytes = 0
+    
+    def _pull(self):
+        """Append the next decoded block to the buffer"""
+        block = next(self._blocks, None)
+        if block is None:
+            # Audio is followed by N_SAMPLES of silence plus the STFT padding
+            self.exhausted = True
+            tail = whisper.audio.N_SAMPLES + whisper.audio.N_FFT // 2
+            self._buffer = np.concatenate([self._buffer, np.zeros(tail, dtype=np.float32)])
+            return
+        self.num_samples += len(block)
+        self._buffer = np.concatenate([self._buffer, block])
+    
+    def _start(self):
+        """Prepend the reflection padding once enough samples are known"""
+        pad = whisper.audio.N_FFT // 2
+        while not self.exhausted and len(self._buffer) <= pad:
+            self._pull()
+        self._buffer = np.concatenate([self._buffer[1:pad + 1][::-1], self._buffer])
+        self._started = True
+    
+    def read(self, start, end):
+        """Return padded-signal samples [start, end)
+        
+        Args:
+            start (int): First index; must not be smaller than a previous start
+            end (int): One past the last index
+            
+        Returns:
+            np.ndarray: The samples (zeros past the end of the padding)
+        """
+        if not self._started:
+            self._start()
+        if start < self.offset:
+            raise ValueError("streaming reads must not move backwards")
+        
+        while not self.exhausted and self.offset + len(self._buffer) < end:
+            self._pull()
+        
+        # Drop samples before the requested start
+        self._buffer = self._buffer[start - self.offset:]
+        self.offset = start
+        self.peak_buffer_bytes = max(self.peak_buffer_bytes, self._buffer.nbytes)
+        
+        samples = self._buffer[:end - start]
+        if len(samples) < end - start:
+            samples = np.concatenate([samples, np.zeros(end - start - len(samples), dtype=np.float32)])
+        return samples
+    
+    def total_frames(self):
+        """Number of spectrogram frames whisper would produce (once exhausted)"""
+        return (self.num_samples + whisper.audio.N_SAMPLES) // whisper.audio.HOP_LENGTH
+
+
+class StreamingMel:
+    """Log-mel spectrogram computed window by window from a decode stream
+    
+    Stands in for the full spectrogram inside whisper.transcribe() (see
+    precomputed_mel()), which only reads its shape and slices it at
+    non-decreasing seek positions. Each slice is computed on demand from a
+    bounded sliding buffer, so memory stays flat however long the recording
+    is, and whisper's own seek logic produces the same timestamps as
+    non-streaming mode.
+    
+    whisper normalizes the spectrogram against its global maximum, so a first
+    pass streams through the file to find that maximum; the file is decoded
+    twice in exchange for features that match the non-streaming ones.
+    """
+    
+    def __init__(self, open_stream, n_mels, chunk_frames=None):
+        """Scan the audio once to find its length and spectrogram maximum
+        
+        Args:
+            open_stream (callable): Returns a fresh iterator of audio blocks
+            n_mels (int): Number of mel bins of the model
+            chunk_frames (int): Frames per chunk in the scanning pass
+        """
+        self.n_mels = n_mels
+        self._open_stream = open_stream
+        self._filters = whisper.audio.mel_filters("cpu", n_mels)
+        self._window = torch.hann_window(whisper.audio.N_FFT)
+        self.windows_computed = 0
+        
+        # First pass: total length and global maximum of the log spectrogram
+        chunk_frames = chunk_frames or whisper.audio.N_FRAMES
+        signal = _PaddedSignal(open_stream())
+        log_max = None
+        frame = 0
+        while True:
+            end_frame = frame + chunk_frames
+            start, stop = self._sample_range(frame, end_frame)
+            samples = signal.read(start, stop)
+            if signal.exhausted:
+                end_frame = min(end_frame, signal.total_frames())
+                if end_frame <= frame:
+                    break
+                samples = samples[:self._sample_range(frame, end_frame)[1] - start]
+            
+            chunk_max = self._log_spec(samples).max()
+            log_max = chunk_max if log_max is None else torch.maximum(log_max, chunk_max)
+            frame = end_frame
+        
+        self.num_samples = signal.num_samples
+        self._log_max = log_max
+        self.shape = (n_mels, signal.total_frames())
+        self.peak_buffer_bytes = signal.peak_buffer_bytes
+        
+        # A zero-copy stand-in for the audio, with the right length
+        self.placeholder = np.broadcast_to(np.zeros(1, dtype=np.float32), (self.num_samples,))
+        self._signal = None
+    
+    @staticmethod
+    def _sample_range(start_frame, end_frame):
+        """Padded-signal samples covering frames [start_frame, end_frame)"""
+        hop = whisper.audio.HOP_LENGTH
+        return start_frame * hop, (end_frame - 1) * hop + whisper.audio.N_FFT
+    
+    def _log_spec(self, samples):
+        """Un-normalized log10 mel spectrogram of whole frames in samples"""
+        stft = torch.stft(
+            torch.from_numpy(np.ascontiguousarray(samples)),
+            whisper.audio.N_FFT,
+            whisper.audio.HOP_LENGTH,
+            window=self._window,
+            center=False,
+            return_complex=True,
+        )
+        mel_spec = self._filters @ (stft.abs() ** 2)
+        return torch.clamp(mel_spec, min=1e-10).log10()
+    
+    def window(self, start_frame, end_frame):
+        """Normalized spectrogram frames [start_frame, end_frame)"""
+        end_frame = min(end_frame, self.shape[1])
+        start, stop = self._sample_range(start_frame, end_frame)
+        if self._signal is None or start < self._signal.offset:
+            # Seeking backwards means decoding again from the start
+            self._signal = _PaddedSignal(self._open_stream())
+        samples = self._signal.read(start, stop)
+        self.peak_buffer_bytes = max(self.peak_buffer_bytes, self._signal.peak_buffer_bytes)
+        self.windows_computed += 1
+        
+        log_spec = torch.maximum(self._log_spec(samples), self._log_max - 8.0)
+        return (log_spec + 4.0) / 4.0
+    
+    def __getitem__(self, index):
+        # whisper.transcribe slices as mel[:, seek : seek + segment_size]
+        _, frames = index
+        return self.window(frames.start or 0, frames.stop)
+
+
+def _window_segments(result, time_offset, segment_size, tokenizer, keep_tail=False):
+    """Split one window's decoding result into timed segments
+    
+    Follows the segmentation in whisper.transcribe() (without word timing),
+    for reporting segments while a streaming transcription is still running
+    and for transcribing outside of it (BatchedTranscriber).
+    
+    Args:
+        result (DecodingResult): Final decoding result for the window
+        time_offset (float): Start of the window in seconds
+        segment_size (int): Number of mel frames in the window
+        tokenizer (whisper.tokenizer.Tokenizer): Tokenizer of the model
+        keep_tail (bool): Keep text after the last complete segment as a
+            segment ending with the window, instead of leaving it for the
+            next window to transcribe again
+        
+    Returns:
+        tuple: (segment dicts with "start", "end", "text" and "tokens",
+            mel frames to advance the seek position by)
+    """
+    time_precision = whisper.audio.HOP_LENGTH * 2 / whisper.audio.SAMPLE_RATE
+    tokens = torch.tensor(result.tokens, dtype=torch.long)
+    timestamp_tokens = tokens.ge(tokenizer.timestamp_begin)
+    single_timestamp_ending = timestamp_tokens[-2:].tolist() == [False, True]
+    consecutive = (torch.where(timestamp_tokens[:-1] & timestamp_tokens[1:])[0] + 1).tolist()
+    
+    def make(start, end, piece):
+        text_tokens = [t for t in piece.tolist() if t < tokenizer.eot]
+        return {"start": start, "end": end, "text": tokenizer.decode(text_tokens), "tokens": text_tokens}
+    
+    segments = []
+    advance = segment_size
+    if consecutive:
+        if single_timestamp_ending:
+            consecutive.append(len(tokens))
+        last_slice = 0
+        for current_slice in consecutive:
+            piece = tokens[last_slice:current_slice]
+            start = (piece[0].item() - tokenizer.timestamp_begin) * time_precision
+            end = (piece[-1].item() - tokenizer.timestamp_begin) * time_precision
+            segments.append(make(time_offset + start, time_offset + end, piece))
+            last_slice = current_slice
+        if not single_timestamp_ending and keep_tail:
+            piece = tokens[last_slice:]
+            start = (piece[0].item() - tokenizer.timestamp_begin) * time_precision
+            end = segment_size * whisper.audio.HOP_LENGTH / whisper.audio.SAMPLE_RATE
+            segments.append(make(time_offset + start, time_offset + max(start, end), piece))
+        elif not single_timestamp_ending:
+            # Resume from the last complete segment, as whisper does
+            advance = (tokens[last_slice - 1].item() - tokenizer.timestamp_begin) * 2
+    else:
+        duration = segment_size * whisper.audio.HOP_LENGTH / whisper.audio.SAMPLE_RATE
+        timestamps = tokens[timestamp_tokens.nonzero().flatten()]
+        if len(timestamps) > 0 and timestamps[-1].item() != tokenizer.timestamp_begin:
+            duration = (timestamps[-1].item() - tokenizer.timestamp_begin) * time_precision
+        segments.append(make(time_offset, time_offset + duration, tokens))
+    
+    segments = [seg for seg in segments if seg["start"] != seg["end"] and seg["text"].strip()]
+    return segments, advance
+
+
+class StreamingSegmentEmitter:
+    """Reports segments of a streaming transcription as windows are finalized
+    
+    Installed as model.decode (under a model lease) it remembers the last
+    decoding result; when whisper moves on to the next window, the previous
+    window's result is final and its segments are passed to the callback.
+    """
+    
+    def __init__(self, model, stream, on_segment, no_speech_threshold=0.6, logprob_threshold=-1.0):
+        """Initialize the emitter
+        
+        Args:
+            model (whisper.model.Whisper): Model being used
+            stream (StreamingMel): Spectrogram source of the transcription
+            on_segment (callable): Called with each finalized segment dict
+            no_speech_threshold (float): whisper.transcribe's silence threshold
+            logprob_threshold (float): whisper.transcribe's log-prob threshold
+        """
+        self.model = model
+        self.stream = stream
+        self.on_segment = on_segment
+        self.no_speech_threshold = no_speech_threshold
+        self.logprob_threshold = logprob_threshold
+        self.tokenizer = whisper.tokenizer.get_tokenizer(
+            model.is_multilingual, num_languages=model.num_languages
+        )
+        self._decode = model.decode
+        self._pending = None
+        self._window = None
+        
+        # Flush the previous window whenever whisper asks for a new one
+        original_window = stream.window
+        
+        def window(start_frame, end_frame):
+            self.flush()
+            self._window = (start_frame, min(end_frame, stream.shape[1]) - start_frame)
+            return original_window(start_frame, end_frame)
+        
+        stream.window = window
+    
+    def decode(self, mel, options=None, **kwargs):
+        """Decode and remember the result; every fallback attempt overwrites it"""
+        if options is None:
+            result = self._decode(mel, **kwargs)
+        else:
+            result = self._decode(mel, options, **kwargs)
+        self._pending = result
+        return result
+    
+    def flush(self):
+        """Emit the segments of the last finalized window"""
+        result, self._pending = self._pending, None
+        if result is None or self._window is None:
+            return
+        
+        # Windows whisper treats as silence produce no segments
+        if result.no_speech_prob > self.no_speech_threshold and result.avg_logprob <= self.logprob_threshold:
+            return
+        seek, segment_size = self._window
+        time_offset = seek * whisper.audio.HOP_LENGTH / whisper.audio.SAMPLE_RATE
+        segments, _ = _window_segments(result, time_offset, segment_size, self.tokenizer)
+        for segment in segments:
+            self.on_segment(segment)
+
+
+class FallbackLimiter:
+    """Counts and bounds whisper's temperature fallbacks
+    
+    Installed as model.decode (under a model lease, outside any other
+    decode wrapper). whisper.transcribe() decodes each window at
+    temperature 0 and again at each higher temperature while the output
+    fails its checks. Once max_fallbacks re-decodes have run, further
+    attempts return the window's previous result instead of decoding, so
+    whisper keeps that result.
+    """
+    
+    def __init__(self, model, max_fallbacks=None):
+        """Initialize the limiter
+        
+        Args:
+            model (whisper.model.Whisper): Model being used
+            max_fallbacks (int): Re-decodes allowed, or None for no limit
+        """
+        self.max_fallbacks = max_fallbacks
+        self._decode = model.decode
+        self._last = None
+        
+        # Statistics
+        self.fallbacks = 0
+        self.skipped = 0
+    
+    def decode(self, mel, options=None, **kwargs):
+        """Replacement for model.decode()"""
+        if options is None:
+            options = whisper.DecodingOptions(**kwargs)
+        if options.temperature > 0 and options.task != "lang_id":
+            if self.max_fallbacks is not None and self.fallbacks >= self.max_fallbacks and self._last is not None:
+                self.skipped += 1
+                return self._last
+            self.fallbacks += 1
+        self._last = self._decode(mel, options)
+        return self._last
+    
+    def summary(self):
+        """Describe the fallbacks taken and skipped"""
+        summary = f"{self.fallbacks} re-decode(s) at higher temperature"
+        if self.max_fallbacks is not None:
+            summary += f" (cap {self.max_fallbacks}, {self.skipped} skipped)"
+        return summary
+
+
+def profile_options(profile):
+    """transcribe() options for a performance profile
+    
+    Args:
+        profile (str): Key of PERFORMANCE_PROFILES, or None for whisper's
+            own defaults
+        
+    Returns:
+        tuple: (options dict, max_fallbacks)
+    """
+    if profile is None:
+        return {}, None
+    if profile not in PERFORMANCE_PROFILES:
+        raise ValueError(f"Unknown performance profile: {profile}")
+    options = dict(PERFORMANCE_PROFILES[profile])
+    return options, options.pop("max_fallbacks")
+
+
+class BatchedTranscriber:
+    """Transcribes several recordings together, batching their 30 s windows
+    
+    whisper.transcribe() runs one window of one file at a time, which leaves
+    most of the matrix-multiply throughput of a CPU unused for the smaller
+    models. This engine advances all files in lockstep: the next window of
+    every unfinished file (up to batch_size of them) goes through one
+    encoder pass and one model.decode() (batched for greedy decoding), then
+    each file's seek position moves on by its own timestamps, exactly as in
+    whisper.
+    
+    Windows are decoded without the previous window's text as a prompt
+    (model.decode() takes one prompt for the whole batch), which matches
+    whisper's condition_on_previous_text=False. Temperature fallback is
+    applied per window: only the windows that fail whisper's compression
+    ratio and log-probability checks are decoded again, as a smaller batch.
+    
+    transcribe_independent() goes further and cuts each recording into fixed
+    30 s windows, so that all windows of even a single file can be batched.
+    """
+    
+    def __init__(self, model, batch_size, options):
+        """Initialize the engine
+        
+        Args:
+            model (whisper.model.Whisper): Model to use (held under a lease)
+            batch_size (int): Maximum windows per forward pass
+            options (dict): transcribe()-style options; "task", "language",
+                "fp16", "temperature", "beam_size", "best_of" and "patience"
+                are used, plus "max_fallbacks" (re-decodes allowed per
+                recording, None for no limit)
+        """
+        self.model = model
+        self.batch_size = max(1, batch_size)
+        self.options = options
+        self.dtype = torch.float16 if options.get("fp16") else torch.float32
+        self.temperatures = options.get("temperature", (0.0, 0.2, 0.4, 0.6, 0.8, 1.0))
+        if isinstance(self.temperatures, (int, float)):
+            self.temperatures = (self.temperatures,)
+        self.tokenizer = whisper.tokenizer.get_tokenizer(
+            model.is_multilingual, num_languages=model.num_languages
+        )
+        
+        # Statistics
+        self.windows = 0
+        self.batches = 0
+        self.fallbacks = 0
+    
+    @staticmethod
+    def batch_size_for(model_name):
+        """Batch size for a model (WHISPER_BATCH_SIZE overrides the table)"""
+        return BATCH_SIZE_OVERRIDE or BATCH_SIZES.get(model_name, 4)
+    
+    def _detect_languages(self, mels):
+        """Language of each recording, from its first window"""
+        if not self.model.is_multilingual:
+            return ["en"] * len(mels)
+        if self.options.get("language"):
+            return [self.options["language"]] * len(mels)
+        
+        languages = []
+        for i in range(0, len(mels), self.batch_size):
+            batch = torch.stack([
+                whisper.pad_or_trim(mel[:, :whisper.audio.N_FRAMES], whisper.audio.N_FRAMES)
+                for mel in mels[i:i + self.batch_size]
+            ])
+            _, probs = self.model.detect_language(batch.to(self.model.device).to(self.dtype))
+            languages.extend(max(p, key=p.get) for p in probs)
+        return languages
+    
+    def _needs_fallback(self, result):
+        """whisper.transcribe()'s criteria for decoding again at a higher temperature"""
+        needs_fallback = result.compression_ratio > 2.4 or result.avg_logprob < -1.0
+        if result.no_speech_prob > 0.6 and result.avg_logprob < -1.0:
+            needs_fallback = False  # Silence: will be skipped anyway
+        return needs_fallback
+    
+    def _decode(self, windows, language, states):
+        """Decode a batch of windows with per-window temperature fallback
+        
+        The encoder runs once for the batch and its output is reused by the
+        fallback passes. Greedy passes decode the batch together; beam search
+        and best-of-n sampling decode one window at a time, since whisper's
+        decode() repeats each window's tokens for its beams or samples but
+        not its audio features.
+        """
+        max_fallbacks = self.options.get("max_fallbacks")
+        with torch.no_grad():
+            features = self.model.embed_audio(windows)
+        results = [None] * len(windows)
+        pending = list(range(len(windows)))
+        for temperature in self.temperatures:
+            options = {
+                "task": self.options.get("task", "transcribe"),
+                "language": language,
+                "temperature": temperature,
+                "fp16": self.options.get("fp16", False),
+            }
+            if temperature > 0:
+                options["best_of"] = self.options.get("best_of")
+            else:
+                options["beam_size"] = self.options.get("beam_size")
+                options["patience"] = self.options.get("patience")
+            
+            decoding = whisper.DecodingOptions(**options)
+            if (options.get("beam_size") or options.get("best_of") or 1) > 1:
+                decoded = [self.model.decode(features[index:index + 1], decoding)[0] for index in pending]
+                self.batches += len(pending)
+            else:
+                decoded = self.model.decode(features[pending], decoding)
+                self.batches += 1
+            if temperature > 0:
+                self.fallbacks += len(pending)
+            
+            still_pending = []
+            for index, result in zip(pending, decoded):
+                results[index] = result
+                if temperature > 0:
+                    states[index]["fallbacks"] += 1
+                if self._needs_fallback(result) and (
+                    max_fallbacks is None or states[index]["fallbacks"] < max_fallbacks
+                ):
+                    still_pending.append(index)
+            pending = still_pending
+            if not pending:
+                break
+        return results
+    
+    def transcribe(self, mels, progress=None, languages=None):
+        """Transcribe recordings from their log-mel spectrograms
+        
+        Args:
+            mels (list): Spectrograms computed with padding=N_SAMPLES
+            progress (callable): Optional progress(fraction) callback
+            languages (list): Language of each recording if already known;
+                detected from the first window otherwise
+            
+        Returns:
+            list: transcribe()-style dicts with "text", "segments",
+                "language" and "fallbacks" (re-decodes taken), in the order
+                of mels
+        """
+        if languages is None or not self.model.is_multilingual:
+            languages = self._detect_languages(mels)
+        states = [
+            {"mel": mel, "frames": mel.shape[-1] - whisper.audio.N_FRAMES, "seek": 0,
+             "segments": [], "language": language, "fallbacks": 0}
+            for mel, language in zip(mels, languages)
+        ]
+        total_frames = sum(state["frames"] for state in states) or 1
+        
+        while True:
+            active = [state for state in states if state["seek"] < state["frames"]]
+            if not active:
+                break
+            
+            # A batch shares one language token
+            language = active[0]["language"]
+            group = [state for state in active if state["language"] == language][:self.batch_size]
+            sizes = [min(whisper.audio.N_FRAMES, state["frames"] - state["seek"]) for state in group]
+            windows = torch.stack([
+                whisper.pad_or_trim(state["mel"][:, state["seek"]:state["seek"] + size], whisper.audio.N_FRAMES)
+                for state, size in zip(group, sizes)
+            ]).to(self.model.device).to(self.dtype)
+            self.windows += len(group)
+            
+            for state, size, result in zip(group, sizes, self._decode(windows, language, group)):
+                # Silent windows are skipped, as in whisper.transcribe()
+                if result.no_speech_prob > 0.6 and result.avg_logprob <= -1.0:
+                    state["seek"] += size
+                    continue
+                time_offset = state["seek"] * whisper.audio.HOP_LENGTH / whisper.audio.SAMPLE_RATE
+                segments, advance = _window_segments(result, time_offset, size, self.tokenizer)
+                state["segments"].extend(segments)
+                state["seek"] += advance if advance > 0 else size
+            
+            if progress is not None:
+                progress(sum(min(state["seek"], state["frames"]) for state in states) / total_frames)
+        
+        return [
+            {
+                "text": "".join(segment["text"] for segment in state["segments"]),
+                "segments": state["segments"],
+                "language": state["language"],
+                "fallbacks": state["fallbacks"],
+            }
+            for state in states
+        ]
+    
+    def transcribe_independent(self, mels, progress=None, languages=None, speech=None):
+        """Transcribe recordings as fixed, independent 30 s windows
+        
+        Unlike transcribe(), a window's start does not depend on the
+        timestamps decoded in the previous one, so every window is known up
+        front and windows of the same file fill a batch together. Text left
+        unfinished at the end of a window is kept up to the window boundary
+        rather than transcribed again from its start, so a word cut by a
+        boundary may be split or misheard.
+        
+        Args:
+            mels (list): Spectrograms computed with padding=N_SAMPLES
+            progress (callable): Optional progress(fraction) callback
+            languages (list): Language of each recording if already known;
+                detected from the first window otherwise
+            speech (list): Speech regions ((start, end) in seconds) of each
+                recording; windows without speech are skipped. None keeps
+                every window
+            
+        Returns:
+            list: transcribe()-style dicts, as from transcribe()
+        """
+        if languages is None or not self.model.is_multilingual:
+            languages = self._detect_languages(mels)
+        states = [{"segments": [], "language": language, "fallbacks": 0} for language in languages]
+        
+        window_seconds = whisper.audio.CHUNK_LENGTH
+        windows = []
+        for index, mel in enumerate(mels):
+            frames = mel.shape[-1] - whisper.audio.N_FRAMES
+            for seek in range(0, frames, whisper.audio.N_FRAMES):
+                start = seek * whisper.audio.HOP_LENGTH / whisper.audio.SAMPLE_RATE
+                regions = None if speech is None else speech[index]
+                if regions is not None and not any(
+                    begin < start + window_seconds and end > start for begin, end in regions
+                ):
+                    continue
+                windows.append((index, seek, min(whisper.audio.N_FRAMES, frames - seek)))
+        
+        # Batch windows of the same language, keeping each file's windows in order
+        by_language = {}
+        for window in windows:
+            by_language.setdefault(states[window[0]]["language"], []).append(window)
+        done = 0
+        for language, group in by_language.items():
+            for i in range(0, len(group), self.batch_size):
+                batch = group[i:i + self.batch_size]
+                stacked = torch.stack([
+                    whisper.pad_or_trim(mels[index][:, seek:seek + size], whisper.audio.N_FRAMES)
+                    for index, seek, size in batch
+                ]).to(self.model.device).to(self.dtype)
+                self.windows += len(batch)
+                
+                owners = [states[index] for index, _, _ in batch]
+                for (index, seek, size), result in zip(batch, self._decode(stacked, language, owners)):
+                    if result.no_speech_prob > 0.6 and result.avg_logprob <= -1.0:
+                        continue
+                    time_offset = seek * whisper.audio.HOP_LENGTH / whisper.audio.SAMPLE_RATE
+                    segments, _ = _window_segments(result, time_offset, size, self.tokenizer, keep_tail=True)
+                    
+                    # Timestamps cannot run past the window into the next one
+                    window_end = time_offset + size * whisper.audio.HOP_LENGTH / whisper.audio.SAMPLE_RATE
+                    for segment in segments:
+                        segment["start"] = min(segment["start"], window_end)
+                        segment["end"] = min(segment["end"], window_end)
+                    states[index]["segments"].extend(seg for seg in segments if seg["start"] < seg["end"])
+                
+                done += len(batch)
+                if progress is not None:
+                    progress(done / len(windows))
+        
+        return [
+            {
+                "text": "".join(segment["text"] for segment in state["segments"]),
+                "segments": state["segments"],
+                "language": state["language"],
+                "fallbacks": state["fallbacks"],
+            }
+            for state in states
+        ]
+
+
+class _SliceRecorder:
+    """Spectrogram wrapper that remembers which window whisper sliced last
+    
+    whisper.transcribe() passes model.decode() only the window, so a decode
+    override that needs the matching window of a second spectrogram (the
+    draft model's, in speculative decoding) looks up its position here.
+    """
+    
+    def __init__(self, mel):
+        self.mel = mel
+        self.shape = mel.shape
+        self.last_slice = None
+    
+    def __getitem__(self, index):
+        self.last_slice = index[1]
+        return self.mel[index]
+
+
+def _offset_causal_attention(attn, q, k, v, mask=None):
+    """Self-attention for several new tokens appended to a kv-cache
+    
+    whisper's attention aligns the causal mask with the start of the keys,
+    which is only right when all keys are new or there is one query.
+    Verifying several draft tokens at once needs the mask shifted to the
+    end of the cached keys.
+    """
+    n_query, n_key = q.shape[1], k.shape[1]
+    if mask is None or n_query == 1 or n_query == n_key:
+        return type(attn).qkv_attention(attn, q, k, v, mask)
+    
+    scale = (q.shape[-1] // attn.n_head) ** -0.25
+    q = q.view(*q.shape[:2], attn.n_head, -1).permute(0, 2, 1, 3)
+    k = k.view(*k.shape[:2], attn.n_head, -1).permute(0, 2, 1, 3)
+    v = v.view(*v.shape[:2], attn.n_head, -1).permute(0, 2, 1, 3)
+    qk = (q * scale) @ (k * scale).transpose(-1, -2) + mask[n_key - n_query:n_key, :n_key]
+    w = torch.nn.functional.softmax(qk.float(), dim=-1).to(q.dtype)
+    return (w @ v).permute(0, 2, 1, 3).flatten(start_dim=2), None
+
+
+class SpeculativeDecoder:
+    """Greedy decoding of a large model, sped up by a small draft model
+    
+    Installed as model.decode (under leases of both models). For greedy
+    windows the draft proposes up to lookahead tokens, and the large model
+    scores all of them in one decoder pass over its kv-cache. The longest
+    prefix that matches the large model's own greedy choices (after the
+    same logit filters) is kept, plus the large model's token at the first
+    mismatch. Every token is therefore the large model's greedy choice and
+    the output is that of plain greedy decoding; only the number of
+    sequential decoder passes shrinks. Beam search and sampled fallback
+    temperatures use the regular decoder.
+    
+    Text tokens are shared between the vocabularies. Special and timestamp
+    tokens are mapped by name, since large-v3 and turbo have one more
+    language token than the smaller models.
+    """
+    
+    def __init__(self, model, draft, draft_mel, mel, lookahead=SPECULATIVE_LOOKAHEAD):
+        """Initialize the decoder
+        
+        Args:
+            model (whisper.model.Whisper): Model whose output is produced
+            draft (whisper.model.Whisper): Smaller model proposing tokens
+            draft_mel (torch.Tensor): Full spectrogram for the draft model
+            mel (_SliceRecorder): Full spectrogram for the model, as passed
+                to whisper.transcribe()
+            lookahead (int): Tokens proposed per verification pass
+        """
+        self.model = model
+        self.draft = draft
+        self.draft_mel = draft_mel
+        self.mel = mel
+        self.lookahead = lookahead
+        self._decode = model.decode
+        
+        tokenizer = whisper.tokenizer.get_tokenizer(model.is_multilingual, num_languages=model.num_languages)
+        draft_tokenizer = whisper.tokenizer.get_tokenizer(draft.is_multilingual, num_languages=draft.num_languages)
+        self.to_draft = self._token_map(tokenizer, draft_tokenizer, model.dims.n_vocab)
+        draft_to_model = self._token_map(draft_tokenizer, tokenizer, draft.dims.n_vocab)
+        self._draft_ids = torch.nonzero(draft_to_model >= 0).flatten()
+        self._model_ids = draft_to_model[self._draft_ids]
+        
+        # Statistics
+        self.proposed = 0
+        self.accepted = 0
+        self.passes = 0
+        self.tokens = 0
+    
+    @staticmethod
+    def _token_map(source, target, n_vocab):
+        """Lookup table from source to target token ids (-1 where missing)"""
+        lookup = torch.arange(n_vocab)
+        lookup[source.eot:] = -1
+        for name, token in source.special_tokens.items():
+            if name in target.special_tokens and token < n_vocab:
+                lookup[token] = target.special_tokens[name]
+        return lookup
+    
+    def decode(self, mel, options=None, **kwargs):
+        """Replacement for model.decode()"""
+        if options is None:
+            options = whisper.DecodingOptions(**kwargs)
+        window = self.mel.last_slice
+        if (
+            options.temperature > 0
+            or options.beam_size is not None
+            or mel.ndim != 2
+            or window is None
+            or options.task == "lang_id"
+        ):
+            return self._decode(mel, options)
+        
+        draft_mel = whisper.pad_or_trim(self.draft_mel[:, window], whisper.audio.N_FRAMES)
+        task = whisper.decoding.DecodingTask(self.model, options)
+        if (self.to_draft[torch.tensor(task.initial_tokens)] < 0).any():
+            return self._decode(mel, options)  # e.g. a language the draft lacks
+        
+        task._main_loop = types.MethodType(
+            lambda task, audio_features, tokens: self._main_loop(task, audio_features, tokens, draft_mel), task
+        )
+        return task.run(mel.unsqueeze(0))[0]
+    
+    @staticmethod
+    def _self_attention_keys(model):
+        """kv-cache keys of a decoder's self-attention layers"""
+        return [module for block in model.decoder.blocks for module in (block.attn.key, block.attn.value)]
+    
+    def _main_loop(self, task, audio_features, tokens, draft_mel):
+        """Speculative version of DecodingTask._main_loop for one greedy sequence"""
+        sum_logprobs = torch.zeros(1, device=audio_features.device)
+        draft_features = self.draft.encoder(draft_mel.unsqueeze(0).to(audio_features.device).to(audio_features.dtype))
+        
+        cache, hooks = self.model.install_kv_cache_hooks()
+        draft_cache, draft_hooks = self.draft.install_kv_cache_hooks()
+        self_keys = self._self_attention_keys(self.model)
+        draft_self_keys = self._self_attention_keys(self.draft)
+        for block in list(self.model.decoder.blocks) + list(self.draft.decoder.blocks):
+            block.attn.qkv_attention = types.MethodType(_offset_causal_attention, block.attn)
+        
+        def truncate(kv_cache, keys, length):
+            for key in keys:
+                if key in kv_cache:
+                    kv_cache[key] = kv_cache[key][:, :length]
+        
+        try:
+            # First pass over the initial tokens, exactly as whisper does
+            logits = self.model.decoder(tokens, audio_features, kv_cache=cache)
+            probs_at_sot = logits[:, task.sot_index].float().softmax(dim=-1)
+            no_speech_probs = probs_at_sot[:, task.tokenizer.no_speech].tolist()
+            
+            pending = [logits[:, -1]]
+            draft_seen = 0
+            generated = 0
+            proposals = []
+            while True:
+                # Take the model's tokens for the verified positions
+                completed = False
+                accepted = 0
+                for position, position_logits in enumerate(pending):
+                    for logit_filter in task.logit_filters:
+                        logit_filter.apply(position_logits, tokens)
+                    tokens, completed = task.decoder.update(tokens, position_logits, sum_logprobs)
+                    generated += 1
+                    if completed or tokens.shape[-1] > task.n_ctx or generated >= task.sample_len:
+                        completed = True
+                        break
+                    if position < len(proposals) and tokens[0, -1].item() == proposals[position]:
+                        accepted += 1
+                    else:
+                        break
+                self.proposed += len(proposals)
+                self.accepted += accepted
+                if completed:
+                    break
+                
+                # The model's cache must hold every token but the newest
+                truncate(cache, self_keys, tokens.shape[-1] - 1)
+                draft_seen = min(draft_seen, tokens.shape[-1] - 1)
+                truncate(draft_cache, draft_self_keys, draft_seen)
+                
+                # Draft proposals, filtered like the model's own choices
+                lookahead = min(self.lookahead, task.n_ctx - tokens.shape[-1], task.sample_len - generated)
+                proposals = []
+                context = tokens
+                for _ in range(max(lookahead, 0)):
+                    draft_logits = self.draft.decoder(
+                        self.to_draft[context[:, draft_seen:]], draft_features, kv_cache=draft_cache
+                    )[:, -1]
+                    draft_seen = context.shape[-1]
+                    mapped = torch.full((1, self.model.dims.n_vocab), -np.inf, device=draft_logits.device)
+                    mapped[:, self._model_ids] = draft_logits[:, self._draft_ids]
+                    for logit_filter in task.logit_filters:
+                        logit_filter.apply(mapped, context)
+                    proposal = mapped.argmax(dim=-1)
+                    proposals.append(proposal.item())
+                    if proposal.item() == task.tokenizer.eot:
+                        break
+                    context = torch.cat([context, proposal[:, None]], dim=-1)
+                
+                # Score the newest token and all proposals in one pass
+                verify = torch.cat([tokens[:, -1:], torch.tensor([proposals], dtype=tokens.dtype, device=tokens.device)], dim=-1)
+                logits = self.model.decoder(verify, audio_features, kv_cache=cache)
+                self.passes += 1
+                pending = [logits[:, i] for i in range(logits.shape[1])]
+        finally:
+            for hook in hooks + draft_hooks:
+                hook.remove()
+            for block in list(self.model.decoder.blocks) + list(self.draft.decoder.blocks):
+                del block.attn.qkv_attention
+        
+        self.tokens += generated
+        return tokens, sum_logprobs, no_speech_probs
+    
+    def summary(self):
+        """Describe the draft's acceptance rate
+        
+        Returns:
+            str: Status line for display
+        """
+        rate = self.accepted / self.proposed if self.proposed else 0.0
+        return (
+            f"{rate:.0%} of {self.proposed} draft tokens accepted, "
+            f"{self.tokens} tokens in {self.passes} verification passes"
+        )
+
+
+class ModelCache:
+    """LRU cache of loaded Whisper models bounded by a memory budget
+    
+    Models are keyed by (model name, device, dtype) so that several models can
+    stay resident at once. When the total size of the cached weights exceeds
+    the budget, the least recently used models are evicted. The most recently
+    loaded model is always kept, even if it alone exceeds the budget.
+    
+    A whisper model is not safe to run from two threads at once (decoding
+    installs key/value cache hooks on the shared modules), so each entry has
+    a lock. Callers take a lease with acquire()/release(); leased models are
+    never evicted and concurrent users of one model take turns on its lock.
+    """
+    
+    def __init__(self, budget_mb=DEFAULT_MODEL_CACHE_MB):
+        """Initialize an empty cache
+        
+        Args:
+            budget_mb (float): Memory budget for cached weights in megabytes
+        """
+        self.budget_bytes = int(budget_mb * 1024 * 1024)
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.load_times = {}
+    
+    @staticmethod
+    def make_key(model_name, device, dtype="float32"):
+        """Build the cache key for a model"""
+        return (model_name, str(device), dtype)
+    
+    def get(self, key, loader):
+        """Return a cached model, loading it on a miss
+        
+        Args:
+            key (tuple): Cache key from make_key()
+            loader (callable): Zero-argument function that loads the model
+            
+        Returns:
+            tuple: (model, cache_hit)
+        """
+        model = self.lookup(key)
+        if model is not None:
+            return model, True
+        
+        # Load outside the lock so hits on other models are not blocked
+        start_time = time.perf_counter()
+        model = loader()
+        load_time = time.perf_counter() - start_time
+        
+        with self._lock:
+            self.misses += 1
+            self.load_times[key] = load_time
+            self._entries[key] = {
+                "model": model,
+                "size": _model_nbytes(model),
+                "lock": threading.Lock(),
+                "leases": 0,
+                "last_used": time.monotonic(),
+            }
+            self._entries.move_to_end(key)
+            self._evict()
+        
+        return model, False
+    
+    def lookup(self, key):
+        """Return a cached model without loading it
+        
+        Args:
+            key (tuple): Cache key from make_key()
+            
+        Returns:
+            torch.nn.Module: Cached model, or None on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            entry["last_used"] = time.monotonic()
+            self.hits += 1
+            return entry["model"]
+    
+    def contains(self, key):
+        """Check whether a model is cached without touching its LRU position"""
+        with self._lock:
+            return key in self._entries
+    
+    def acquire(self, key, model):
+        """Take a lease on a cached model
+        
+        Args:
+            key (tuple): Cache key from make_key()
+            model (torch.nn.Module): The model instance the caller expects
+            
+        Returns:
+            dict: The cache entry, or None if the model has been evicted in
+                the meantime and must be requested again
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry["model"] is not model:
+                return None
+            entry["leases"] += 1
+            entry["last_used"] = time.monotonic()
+            self._entries.move_to_end(key)
+            return entry
+    
+    def release(self, entry):
+        """Return a lease taken with acquire()"""
+        with self._lock:
+            entry["leases"] -= 1
+            entry["last_used"] = time.monotonic()
+            self._evict()
+    
+    def evict_idle(self, idle_seconds):
+        """Evict models that have not been used for a while
+        
+        Args:
+            idle_seconds (float): Minimum time since last use
+            
+        Returns:
+            int: Number of models evicted
+        """
+        now = time.monotonic()
+        evicted = 0
+        with self._lock:
+            for key, entry in list(self._entries.items()):
+                if entry["leases"] == 0 and now - entry["last_used"] >= idle_seconds:
+                    del self._entries[key]
+                    self.evictions += 1
+                    evicted += 1
+                    print(f"Unloaded idle model {key[0]} ({key[1]}, {key[2]})")
+        return evicted
+    
+    def _evict(self):
+        """Evict least recently used models until within budget (lock held)"""
+        for key in list(self._entries)[:-1]:
+            if self.total_bytes() <= self.budget_bytes:
+                break
+            if self._entries[key]["leases"] > 0:
+                continue
+            del self._entries[key]
+            self.evictions += 1
+            print(f"Evicted model {key[0]} ({key[1]}, {key[2]}) from cache")
+    
+    def total_bytes(self):
+        """Total size of cached model weights in bytes"""
+        return sum(entry["size"] for entry in self._entries.values())
+    
+    def summary(self):
+        """Short description of cache contents and statistics
+        
+        Returns:
+            str: Status line for display
+        """
+        with self._lock:
+            names = ", ".join(
+                key[0] if key[2] == "float32" else f"{key[0]} ({key[2]})"
+                for key in self._entries
+            ) or "empty"
+            return (
+                f"cache: {names} | {_format_bytes(self.total_bytes())} / "
+                f"{_format_bytes(self.budget_bytes)} | "
+                f"hits {self.hits}, misses {self.misses}, evictions {self.evictions}"
+            )
+
+
+class BackgroundModelLoader:
+    """Loads models into a ModelCache on a background thread
+    
+    Each requested model goes through the states queued -> loading -> ready
+    (or failed). Requests for a model that is already queued or loading share
+    the same future, so a model is never loaded twice concurrently.
+    """
+    
+    QUEUED = "queued"
+    LOADING = "loading"
+    READY = "ready"
+    FAILED = "failed"
+    
+    def __init__(self, cache):
+        """Initialize the loader
+        
+        Args:
+            cache (ModelCache): Cache that loaded models are stored in
+        """
+        self.cache = cache
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="model-loader")
+        self._futures = {}
+        self._states = {}
+        self._lock = threading.Lock()
+    
+    def request(self, key, loader):
+        """Request a model load without blocking
+        
+        Args:
+            key (tuple): Cache key from ModelCache.make_key()
+            loader (callable): Zero-argument function that loads the model
+            
+        Returns:
+            Future: Resolves to the loaded model
+        """
+        with self._lock:
+            future = self._futures.get(key)
+            if future is not None:
+                return future
+            
+            model = self.cache.lookup(key)
+            if model is not None:
+                future = Future()
+                future.set_result(model)
+                self._states.setdefault(key, {})["state"] = self.READY
+                return future
+            
+            self._states[key] = {"state": self.QUEUED}
+            future = self._executor.submit(self._load, key, loader)
+            self._futures[key] = future
+            return future
+    
+    def _load(self, key, loader):
+        """Load a model on the background thread"""
+        with self._lock:
+            self._states[key] = {"state": self.LOADING}
+        try:
+            model, _ = self.cache.get(key, loader)
+        except Exception as e:
+            with self._lock:
+                self._states[key] = {"state": self.FAILED, "error": str(e)}
+                self._futures.pop(key, None)
+            raise
+        
+        with self._lock:
+            self._states[key] = {"state": self.READY, "load_time": self.cache.load_times.get(key)}
+            self._futures.pop(key, None)
+        return model
+    
+    def state(self, key):
+        """Current load state of a model
+        
+        Returns:
+            dict: State information, or None if the model was never requested
+        """
+        with self._lock:
+            state = self._states.get(key)
+            if state is not None and state["state"] == self.READY and key not in self._futures:
+                # The model may have been evicted since it was loaded
+                if not self.cache.contains(key):
+                    return None
+            return dict(state) if state is not None else None
+
+
+def _available_cores():
+    """CPU cores this process may run on"""
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+# Application instance inside a replica worker process
+_replica_app = None
+
+
+def _replica_init(cores, threads, model_name, compute_mode):
+    """Set up a replica worker: pin it to its cores and load its model"""
+    global _replica_app
+    if cores and hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, cores)
+    torch.set_num_threads(threads)
+    
+    _replica_app = LocalWhisperGUI(preload_model=None, replicas=0)
+    _replica_app.get_model(model_name, compute_mode)
+
+
+def _replica_ping():
+    """No-op task used to start a replica and wait for its model"""
+    return os.getpid()
+
+
+def _replica_transcribe(audio_path, language, model_name, compute_mode, streaming=False, vad=False,
+                        speculative=None, profile=None, independent=False):
+    """Transcribe a file on a replica's own model"""
+    return _replica_app.transcribe_audio(
+        audio_path, language, model_name, compute_mode, streaming=streaming, vad=vad, speculative=speculative,
+        profile=profile, independent=independent
+    )
+
+
+def _replica_transcribe_span(audio_path, audio_hash, start, end, options, model_name, compute_mode,
+                             max_fallbacks=None):
+    """Transcribe part of a file on a replica's own model"""
+    return _replica_app.transcribe_span(
+        audio_path, audio_hash, start, end, options, model_name, compute_mode, max_fallbacks
+    )
+
+
+def _replica_detect_language(audio_path, audio_hash, start, model_name, compute_mode):
+    """Detect the language of part of a file on a replica's own model"""
+    return _replica_app.detect_language_span(audio_path, audio_hash, start, model_name, compute_mode)
+
+
+def _replica_benchmark(model_name, compute_mode):
+    """Time one encoder and short decoder pass on a replica's model"""
+    with _replica_app.lease_model(model_name, compute_mode) as model:
+        return warm_up_model(model)
+
+
+class ReplicaPool:
+    """Worker processes that each hold a replica of one model
+    
+    A single transcription scales poorly across many cores, so instead the
+    cores are split into slices and each replica runs in its own process,
+    pinned to its slice with a matching torch.set_num_threads(). Work goes to
+    the replica with the fewest outstanding tasks. With the memory-mapped
+    weight store, replicas share one copy of the weights in the page cache.
+    """
+    
+    def __init__(self, model_name, compute_mode, replicas, threads_per_replica):
+        """Create the pool (worker processes start on first use)
+        
+        Args:
+            model_name (str): Model each replica loads
+            compute_mode (str): "float32" or "int8"
+            replicas (int): Number of worker processes
+            threads_per_replica (int): torch threads per worker
+        """
+        self.model_name = model_name
+        self.compute_mode = compute_mode
+        self.replicas = replicas
+        self.threads_per_replica = threads_per_replica
+        
+        cores = _available_cores()
+        context = multiprocessing.get_context("spawn")
+        self._executors = []
+        for i in range(replicas):
+            # Only pin when there are enough cores for disjoint slices
+            core_slice = cores[i * threads_per_replica:(i + 1) * threads_per_replica]
+            if len(core_slice) < threads_per_replica:
+                core_slice = None
+            self._executors.append(ProcessPoolExecutor(
+                max_workers=1,
+                mp_context=context,
+                initializer=_replica_init,
+                initargs=(core_slice, threads_per_replica, model_name, compute_mode)
+            ))
+        
+        self._outstanding = [0] * replicas
+        self._lock = threading.Lock()
+        self._start_futures = []
+        
+        # Jobs leasing the pool, counted by LocalWhisperGUI under its pool lock
+        self.users = 0
+        self.retired = False
+    
+    def start(self):
+        """Start every replica and load its model without blocking"""
+        with self._lock:
+            if not self._start_futures:
+                self._start_futures = [executor.submit(_replica_ping) for executor in self._executors]
+        return self._start_futures
+    
+    def submit(self, fn, *args):
+        """Run a task on the least busy replica
+        
+        Returns:
+            Future: Result of fn(*args) in the worker process
+        """
+        with self._lock:
+            index = min(range(self.replicas), key=lambda i: self._outstanding[i])
+            self._outstanding[index] += 1
+        
+        future = self._executors[index].submit(fn, *args)
+        
+        def _done(_, index=index):
+            with self._lock:
+                self._outstanding[index] -= 1
+        
+        future.add_done_callback(_done)
+        return future
+    
+    def status(self):
+        """Describe how many replicas are ready
+        
+        Returns:
+            str: Status message
+        """
+        label = f"{self.model_name} ({self.compute_mode})" if self.compute_mode != "float32" else self.model_name
+        futures = self.start()
+        errors = [f.exception() for f in futures if f.done() and f.exception() is not None]
+        if errors:
+            return f"❌ Error starting replicas of '{label}': {errors[0]}"
+        ready = sum(1 for f in futures if f.done())
+        layout = f"{self.replicas} replicas x {self.threads_per_replica} threads"
+        if ready < self.replicas:
+            return f"🔄 Starting replicas of '{label}' ({ready}/{self.replicas} ready, {layout})..."
+        return f"✅ Model '{label}' ready on {layout}"
+    
+    def idle(self):
+        """Whether no tasks are queued or running"""
+        with self._lock:
+            return not any(self._outstanding)
+    
+    def shutdown(self):
+        """Stop the worker processes once their queued work is done"""
+        for executor in self._executors:
+            executor.shutdown(wait=False)
+
+
+def calibrate_replicas(model_name, compute_mode="float32", max_replicas=8, rounds=2):
+    """Find the replica count with the best throughput on this machine
+    
+    Each candidate splits the available cores evenly between 1, 2, 4, ...
+    replicas and runs a short synthetic encode/decode on every replica.
+    
+    Args:
+        model_name (str): Model to calibrate
+        compute_mode (str): "float32" or "int8"
+        max_replicas (int): Largest replica count to try
+        rounds (int): Timed tasks per replica
+        
+    Returns:
+        tuple: (best_layout, measurements) where best_layout is
+            (replicas, threads_per_replica) and measurements is a list of
+            (replicas, threads_per_replica, tasks_per_second)
+    """
+    cores = len(_available_cores())
+    measurements = []
+    replicas = 1
+    while replicas <= min(cores, max_replicas):
+        threads = max(1, cores // replicas)
+        pool = ReplicaPool(model_name, compute_mode, replicas, threads)
+        try:
+            # Untimed round: start the workers and warm their models
+            for future in pool.start():
+                future.result()
+            
+            start_time = time.perf_counter()
+            futures = [
+                pool.submit(_replica_benchmark, model_name, compute_mode)
+                for _ in range(replicas * rounds)
+            ]
+            for future in futures:
+                future.result()
+            throughput = len(futures) / (time.perf_counter() - start_time)
+        finally:
+            pool.shutdown()
+        
+        measurements.append((replicas, threads, throughput))
+        print(f"Calibration: {replicas} x {threads} threads -> {throughput:.2f} tasks/s")
+        replicas *= 2
+    
+    best = max(measurements, key=lambda m: m[2])
+    return (best[0], best[1]), measurements
+
 
 class LocalWhisperGUI:
     """Main application class for Local Whisper GUI"""
     
-    def __init__(self):
-        """Initialize the GUI application"""
-        self.model = None
-        self.model_name = "base"
+    AVAILABLE_MODELS = ["tiny", "base", "small", "medium", "large", "turbo"]
+    
+    def __init__(self, model_cache_mb=DEFAULT_MODEL_CACHE_MB, mmap_weights=MMAP_WEIGHTS,
+                 warmup=WARMUP_MODELS, replicas=DEFAULT_REPLICAS,
+                 threads_per_replica=DEFAULT_THREADS_PER_REPLICA, preload_model="base",
+                 idle_timeout=DEFAULT_IDLE_TIMEOUT, prefetch_depth=DEFAULT_PREFETCH_DEPTH,
+                 prefetch_workers=DEFAULT_PREFETCH_WORKERS):
+        """Initialize the GUI application
+        
+        Args:
+            model_cache_mb (float): Memory budget for cached models in megabytes
+            mmap_weights (bool): Load weights memory-mapped from the local weight store
+            warmup (bool): Run a synthetic clip through each model after loading it
+            replicas (int or str): Worker processes holding model replicas;
+                0 transcribes in this process, "auto" calibrates on first use
+            threads_per_replica (int): torch threads per replica (0 = even split)
+            preload_model (str): Model to start loading at startup, or None
+            idle_timeout (float): Unload models unused for this many seconds (0 = never)
+            prefetch_depth (int): Batch files prepared ahead of the one being
+                transcribed (0 = strictly sequential)
+            prefetch_workers (int): Threads decoding and featurizing ahead
+        """
         self.sample_rate = 16000  # Whisper's preferred sample rate
+        self._device = None
+        
+        # In-process audio decoding
+        self.audio_loader = AudioLoader(self.sample_rate)
+        self.mel_cache = MelCache()
+        
+        # Languages identified by the small model, by (audio hash, start sample)
+        self.language_cache = OrderedDict()
+        self._language_lock = threading.Lock()
+        
+        # Batch decoding runs ahead of inference on worker threads
+        self.prefetch_depth = prefetch_depth
+        self.prefetch_workers = max(1, prefetch_workers)
+        
+        # Loaded models, shared across model switches
+        self.model_cache = ModelCache(budget_mb=model_cache_mb)
+        self.model_loader = BackgroundModelLoader(self.model_cache)
+        
+        # Checkpoints are hashed once, not on every model load
+        self.verifier = CheckpointVerifier()
+        
+        # Memory-mapped checkpoints shared with other processes on this host
+        self.weight_store = MmapWeightStore(self.verifier) if mmap_weights else None
+        
+        # Size and speed measurements for int8 quantized models, by cache key
+        self.quantization_reports = {}
+        
+        # Warm-up cost and request latencies per loaded model, by cache key
+        self.warmup = warmup
+        self.latency_stats = {}
+        self._stats_lock = threading.Lock()
+        
+        # Optional pool of model replicas in worker processes
+        self.replicas = replicas if replicas == "auto" else int(replicas)
+        self.threads_per_replica = threads_per_replica
+        self.replica_calibration = {}
+        self._replica_pool = None
+        self._replica_pool_last_used = time.monotonic()
+        self._pool_lock = threading.Lock()
+        
+        # Unload idle models in the background
+        self.idle_timeout = idle_timeout
+        if idle_timeout > 0:
+            threading.Thread(target=self._idle_janitor, name="idle-janitor", daemon=True).start()
         
         # Available models (including newer ones)
-        self.available_models = ["tiny", "base", "small", "medium", "large", "turbo"]
+        self.available_models = list(self.AVAILABLE_MODELS)
         
         # Language options
         self.language_options = {
@@ -45,55 +2760,485 @@ class LocalWhisperGUI:
             "Japanese": "ja"
         }
         
-        # Load model on startup
-        self.load_model()
+        # Start loading the default model in the background; this also
+        # imports torch and whisper off the startup path
+        if preload_model is not None:
+            threading.Thread(
+                target=self.load_model, args=(preload_model,), name="model-preload", daemon=True
+            ).start()
+    
+    @property
+    def device(self):
+        """Device models are loaded on (resolved on first use)"""
+        if self._device is None:
+            self._device = "cuda" if torch.cuda.is_available() else "cpu"
+        return self._device
+    
+    def _model_key(self, model_name, compute_mode="float32"):
+        """Cache key for a model in a given compute mode"""
+        # Quantized and ONNX Runtime inference are CPU-only
+        device = "cpu" if compute_mode in ("int8", "onnx") else self.device
+        return ModelCache.make_key(model_name, device, compute_mode)
+    
+    def _build_model(self, model_name, compute_mode):
+        """Load a Whisper model and prepare it for the given compute mode
+        
+        Args:
+            model_name (str): Name of the model to load
+            compute_mode (str): "float32", "int8" or "onnx"
+            
+        Returns:
+            whisper.model.Whisper: Loaded model (OnnxWhisper for "onnx")
+        """
+        key = self._model_key(model_name, compute_mode)
+        if compute_mode == "onnx":
+            model_dir = onnx_model_dir(model_name)
+            if not os.path.exists(os.path.join(model_dir, "model.json")):
+                raise FileNotFoundError(
+                    f"Model '{model_name}' has not been exported to ONNX yet; "
+                    f"run: python whisper_gui.py --export-onnx {model_name}"
+                )
+            model = OnnxWhisper(model_dir)
+        elif self.weight_store is not None and self.weight_store.supports(model_name):
+            model = self.weight_store.load(model_name, device=key[1])
+        elif model_name in whisper._MODELS:
+            # Loading by path skips whisper's own hash check; the verifier has done it
+            model = whisper.load_model(self.verifier.checkpoint_path(model_name), device=key[1])
+            model.set_alignment_heads(whisper._ALIGNMENT_HEADS[model_name])
+        else:
+            model = whisper.load_model(model_name, device=key[1])
+        
+        if compute_mode == "int8":
+            model, report = quantize_model_int8(model)
+            self.quantization_reports[key] = report
+        
+        # Latencies are tracked per loaded instance; a reload starts fresh
+        stats = {"warmup_s": None, "first_request_s": None, "requests": 0, "steady_total_s": 0.0}
+        if self.warmup:
+            stats["warmup_s"] = warm_up_model(model, fp16=key[1] == "cuda")
+        with self._stats_lock:
+            self.latency_stats[key] = stats
+        return model
+    
+    def _record_latency(self, key, seconds):
+        """Record the duration of a transcription request
+        
+        Args:
+            key (tuple): Cache key of the model used
+            seconds (float): Request duration
+        """
+        with self._stats_lock:
+            stats = self.latency_stats.get(key)
+            if stats is None:
+                return
+            if stats["requests"] == 0:
+                stats["first_request_s"] = seconds
+            else:
+                stats["steady_total_s"] += seconds
+            stats["requests"] += 1
+    
+    def _latency_details(self, key, seconds):
+        """Format request latency next to the warm-up and steady-state figures"""
+        with self._stats_lock:
+            stats = dict(self.latency_stats.get(key, {}))
+        
+        parts = [f"this request {seconds:.2f}s"]
+        if stats.get("warmup_s") is not None:
+            parts.append(f"warm-up {stats['warmup_s']:.2f}s")
+        if stats.get("first_request_s") is not None:
+            parts.append(f"first request {stats['first_request_s']:.2f}s")
+        if stats.get("requests", 0) > 1:
+            steady = stats["steady_total_s"] / (stats["requests"] - 1)
+            parts.append(f"steady-state mean {steady:.2f}s")
+        return f"**Latency:** {', '.join(parts)}\n"
+    
+    def _request_model(self, model_name, compute_mode="float32"):
+        """Queue a model load on the background loader
+        
+        Args:
+            model_name (str): Name of the model to load
+            compute_mode (str): "float32" or "int8"
+            
+        Returns:
+            Future: Resolves to the loaded model
+        """
+        key = self._model_key(model_name, compute_mode)
+        return self.model_loader.request(
+            key, lambda: self._build_model(model_name, compute_mode)
+        )
     
-    def load_model(self, model_name="base"):
-        """Load Whisper model
+    def load_model(self, model_name="base", compute_mode="float32"):
+        """Start loading a Whisper model without blocking
         
         Args:
             model_name (str): Name of the model to load
+            compute_mode (str): "float32", "int8" (dynamic int8 quantization on CPU)
+                or "onnx" (ONNX Runtime backend, see export_onnx())
             
         Returns:
             str: Status message
         """
         try:
-            if self.model is None or self.model_name != model_name:
-                self.model_name = model_name
-                self.model = whisper.load_model(model_name)
-                return f"✅ Model '{model_name}' loaded successfully!"
-            return f"✅ Model '{model_name}' already loaded"
+            pool = self._replica_pool_for(model_name, compute_mode)
+            if pool is not None:
+                pool.start()
+            else:
+                self._request_model(model_name, compute_mode)
         except Exception as e:
             return f"❌ Error loading model: {str(e)}"
+        return self.model_status(model_name, compute_mode)
+    
+    def model_status(self, model_name, compute_mode="float32"):
+        """Describe the load state of a model
+        
+        Args:
+            model_name (str): Name of the model
+            compute_mode (str): "float32" or "int8"
+            
+        Returns:
+            str: Status message
+        """
+        if self.replicas:
+            pool = self._replica_pool
+            if pool is not None and (pool.model_name, pool.compute_mode) == (model_name, compute_mode):
+                return pool.status()
+        
+        key = self._model_key(model_name, compute_mode)
+        label = f"{model_name} ({compute_mode})" if compute_mode != "float32" else model_name
+        state = self.model_loader.state(key)
+        if state is None:
+            return f"ℹ️ Model '{label}' not loaded yet - click Load Model or transcribe to load it"
+        if state["state"] == BackgroundModelLoader.QUEUED:
+            return f"⏳ Model '{label}' queued for loading..."
+        if state["state"] == BackgroundModelLoader.LOADING:
+            return f"🔄 Loading model '{label}'..."
+        if state["state"] == BackgroundModelLoader.FAILED:
+            return f"❌ Error loading model: {state.get('error', 'unknown error')}"
+        
+        load_time = state.get("load_time")
+        timing = f" in {load_time:.1f}s" if load_time is not None else ""
+        warmup_s = self.latency_stats.get(key, {}).get("warmup_s")
+        if load_time is not None and warmup_s is not None:
+            timing += f" (incl. {warmup_s:.1f}s warm-up)"
+        return f"✅ Model '{label}' loaded successfully{timing}! ({self.resident_summary()})"
+    
+    def resident_summary(self):
+        """Describe loaded models and process memory for the status box"""
+        summary = self.model_cache.summary()
+        rss = _process_rss()
+        if rss is not None:
+            summary += f" | process RSS {_format_bytes(rss)}"
+        if self.idle_timeout >= 120:
+            summary += f" | idle unload after {self.idle_timeout / 60:.0f} min"
+        elif self.idle_timeout > 0:
+            summary += f" | idle unload after {self.idle_timeout:.0f}s"
+        return summary
+    
+    def get_model(self, model_name, compute_mode="float32"):
+        """Wait until a model is ready and return it
+        
+        Args:
+            model_name (str): Name of the model
+            compute_mode (str): "float32" or "int8"
+            
+        Returns:
+            torch.nn.Module: Loaded Whisper model
+        """
+        return self._request_model(model_name, compute_mode).result()
+    
+    def _idle_janitor(self):
+        """Periodically unload models and replica pools that sit idle"""
+        while True:
+            time.sleep(max(1.0, min(self.idle_timeout / 4, 60.0)))
+            self.unload_idle()
+    
+    def unload_idle(self, idle_seconds=None):
+        """Unload models that have not been used recently and reclaim their memory
+        
+        Args:
+            idle_seconds (float): Idle time before unloading (defaults to idle_timeout)
+            
+        Returns:
+            int: Number of models (and replica pools) unloaded
+        """
+        if idle_seconds is None:
+            idle_seconds = self.idle_timeout
+        unloaded = self.model_cache.evict_idle(idle_seconds)
+        
+        with self._pool_lock:
+            pool = self._replica_pool
+            if pool is not None and time.monotonic() - self._replica_pool_last_used >= idle_seconds:
+                if pool.idle() and not pool.users:
+                    pool.shutdown()
+                    self._replica_pool = None
+                    unloaded += 1
+                    print(f"Stopped idle replicas of '{pool.model_name}'")
+        
+        if unloaded:
+            reclaim_memory()
+        return unloaded
+    
+    def _replica_layout(self, model_name, compute_mode):
+        """Number of replicas and threads per replica for a model
+        
+        Returns:
+            tuple: (replicas, threads_per_replica)
+        """
+        if self.replicas == "auto":
+            key = (model_name, compute_mode)
+            if key not in self.replica_calibration:
+                self.replica_calibration[key], _ = calibrate_replicas(model_name, compute_mode)
+            return self.replica_calibration[key]
+        
+        threads = self.threads_per_replica or max(1, len(_available_cores()) // self.replicas)
+        return self.replicas, threads
     
-    def transcribe_audio(self, audio_path, language=None, model_name="base"):
+    def _replica_pool_for(self, model_name, compute_mode, fallback_replicas=0, lease=False):
+        """Return the replica pool for a model, replacing a pool for another model
+        
+        A replaced pool that jobs still lease keeps running until the last of
+        them hands it back, so their remaining chunks can still be submitted.
+        
+        Args:
+            model_name (str): Model the replicas hold
+            compute_mode (str): "float32" or "int8"
+            fallback_replicas (int): Pool size to use when replicas are
+                disabled, for work that needs worker processes anyway
+            lease (bool): Hold the pool for a job; it must be handed back
+                with _release_replica_pool()
+        
+        Returns:
+            ReplicaPool: The pool, or None when replicas are disabled
+        """
+        if not self.replicas and not fallback_replicas:
+            return None
+        
+        with self._pool_lock:
+            self._replica_pool_last_used = time.monotonic()
+            pool = self._replica_pool
+            if pool is None or (pool.model_name, pool.compute_mode) != (model_name, compute_mode):
+                if pool is not None:
+                    if pool.users:
+                        pool.retired = True
+                    else:
+                        pool.shutdown()
+                
+                if self.replicas:
+                    replicas, threads = self._replica_layout(model_name, compute_mode)
+                else:
+                    replicas = fallback_replicas
+                    threads = max(1, len(_available_cores()) // replicas)
+                pool = self._replica_pool = ReplicaPool(model_name, compute_mode, replicas, threads)
+            if lease:
+                pool.users += 1
+            return pool
+    
+    def _release_replica_pool(self, pool):
+        """End a job's lease on a pool from _replica_pool_for(lease=True)
+        
+        The last job on a replaced pool stops it. Without the idle janitor
+        (idle_timeout of 0) nothing else would stop a fallback pool started
+        only for long-file jobs, so it is also stopped once its last job is
+        done.
+        """
+        if pool is None:
+            return
+        with self._pool_lock:
+            pool.users -= 1
+            if pool.users:
+                return
+            if pool.retired:
+                pool.shutdown()
+            elif not self.replicas and self.idle_timeout <= 0 and self._replica_pool is pool:
+                pool.shutdown()
+                self._replica_pool = None
+    
+    @contextmanager
+    def lease_model(self, model_name, compute_mode="float32"):
+        """Use a loaded model exclusively for the duration of a request
+        
+        Waits for the model to be ready, protects it from eviction and holds
+        its lock, so concurrent requests for the same model share one instance
+        safely while requests for different models run in parallel.
+        
+        Args:
+            model_name (str): Name of the model
+            compute_mode (str): "float32" or "int8"
+            
+        Yields:
+            whisper.model.Whisper: The loaded model
+        """
+        key = self._model_key(model_name, compute_mode)
+        entry = None
+        while entry is None:
+            model = self._request_model(model_name, compute_mode).result()
+            entry = self.model_cache.acquire(key, model)
+        
+        try:
+            with entry["lock"]:
+                yield entry["model"]
+        finally:
+            self.model_cache.release(entry)
+    
+    def _quantization_details(self, model_name):
+        """Format the int8 quantization report for the details output"""
+        report = self.quantization_reports.get(self._model_key(model_name, "int8"))
+        if report is None:
+            return ""
+        size_ratio = report["fp32_bytes"] / max(report["int8_bytes"], 1)
+        speedup = report["fp32_encoder_s"] / max(report["int8_encoder_s"], 1e-9)
+        return (
+            f"**Quantization:** weights {_format_bytes(report['fp32_bytes'])} → "
+            f"{_format_bytes(report['int8_bytes'])} ({size_ratio:.1f}x smaller), "
+            f"encoder {speedup:.1f}x faster\n"
+        )
+    
+    def transcribe_audio(self, audio_path, language=None, model_name="base", compute_mode="float32",
+                         streaming=False, on_segment=None, vad=False, prepared=None, parallel=False,
+                         chunk_seconds=DEFAULT_CHUNK_SECONDS, speculative=None, profile=None,
+                         independent=False):
         """Transcribe audio file using local Whisper
         
         Args:
             audio_path (str): Path to the audio file
             language (str): Language code or None for auto-detection
             model_name (str): Model name to use for transcription
+            compute_mode (str): "float32", "int8" (dynamic int8 quantization on CPU)
+                or "onnx" (ONNX Runtime backend, see export_onnx())
+            streaming (bool): Decode and featurize incrementally with bounded
+                memory instead of loading the whole file (for long recordings)
+            on_segment (callable): In streaming mode, called with each segment
+                dict ("start", "end", "text") as soon as its window is final;
+                such requests run in this process even with a replica pool
+            vad (bool): Skip long silences found by detect_speech(); not
+                available in streaming mode
+            prepared (dict): Result of prepare_audio() for this file, when it
+                was decoded ahead of time
+            parallel (bool): Split the file at silences into chunks of about
+                chunk_seconds and transcribe them in parallel on worker
+                processes; takes precedence over streaming and vad
+            chunk_seconds (float): Target chunk length for parallel mode
+            speculative (str): Draft model ("tiny" or "base") for speculative
+                greedy decoding; used only when smaller than model_name
+            profile (str): Key of PERFORMANCE_PROFILES, or None for
+                whisper's default decoding settings
+            independent (bool): Decode fixed 30 s windows independently and
+                in batches (BatchedTranscriber.transcribe_independent());
+                faster on long files, slightly less accurate at window
+                boundaries, no word timestamps or speculative decoding
             
         Returns:
             tuple: (transcription_text, details_text)
         """
         try:
-            # Load model if needed
-            if self.model is None or self.model_name != model_name:
-                self.load_model(model_name)
+            if parallel and isinstance(audio_path, (str, os.PathLike)):
+                return self._transcribe_parallel(
+                    audio_path, language, model_name, compute_mode, chunk_seconds, profile
+                )
+            
+            # Hand the request to a replica when a pool is configured. A
+            # callback cannot be called from another process, so live
+            # segment streaming stays in this one
+            pool = None
+            if not (streaming and on_segment is not None):
+                pool = self._replica_pool_for(model_name, compute_mode, lease=True)
+            if pool is not None:
+                try:
+                    return pool.submit(
+                        _replica_transcribe, audio_path, language, model_name, compute_mode, streaming, vad,
+                        speculative, profile, independent
+                    ).result()
+                finally:
+                    self._release_replica_pool(pool)
+            
+            device = self._model_key(model_name, compute_mode)[1]
             
             # Prepare options
             options = {
                 "task": "transcribe",
-                "fp16": torch.cuda.is_available(),  # Use FP16 if GPU available
+                "fp16": device == "cuda",  # Use FP16 if GPU available
             }
             
             # Add language if specified
             if language and language != "Auto-detect":
                 options["language"] = language
             
-            # Transcribe
-            result = self.model.transcribe(audio_path, **options)
+            decoding, max_fallbacks = profile_options(profile)
+            options.update(decoding)
+            
+            if streaming and isinstance(audio_path, (str, os.PathLike)):
+                return self._transcribe_streaming(
+                    audio_path, options, model_name, compute_mode, on_segment, profile
+                )
+            
+            # Decode before leasing the model so it isn't held during I/O
+            if prepared is None:
+                prepared = self.prepare_audio(audio_path, model_name, compute_mode, vad=vad, featurize=independent)
+            decoded = prepared["decoded"]
+            audio = prepared["audio"]
+            mel = prepared["mel"]
+            
+            # Only send speech regions to the model; whisper's clip_timestamps
+            # keeps segment timestamps on the original timeline
+            speech = prepared["speech"]
+            if vad:
+                if not speech:
+                    return "", "**Voice Activity:** no speech detected\n"
+                options["clip_timestamps"] = [t for region in speech for t in region]
+            
+            # Let the small model find the language for a larger one
+            language_id = None
+            if "language" not in options and self._uses_language_id(model_name):
+                first = int(speech[0][0] * self.sample_rate) if speech else 0
+                detected, cache_hit = self.identify_language(
+                    audio, decoded["hash"] if decoded else None, compute_mode, first
+                )
+                if detected:
+                    options["language"] = detected
+                    language_id = f"{detected} by {LANGUAGE_ID_MODEL}{' (cached)' if cache_hit else ''}"
+            
+            # Transcribe on a leased model; this waits for a pending load
+            # instead of starting a second one and never touches shared state
+            with self.lease_model(model_name, compute_mode) as model:
+                start_time = time.perf_counter()
+                
+                # whisper detects the language from the first 30 s, which may
+                # be silence; use the first speech region instead
+                if speech and "language" not in options and model.is_multilingual:
+                    first = int(speech[0][0] * self.sample_rate)
+                    window = whisper.log_mel_spectrogram(whisper.pad_or_trim(audio[first:]), model.dims.n_mels)
+                    dtype = torch.float16 if options["fp16"] else torch.float32
+                    _, probs = model.detect_language(window.to(model.device).to(dtype))
+                    options["language"] = max(probs, key=probs.get)
+                
+                speculation = None
+                engine = None
+                if independent:
+                    if mel is None:
+                        mel = whisper.log_mel_spectrogram(audio, model.dims.n_mels, padding=whisper.audio.N_SAMPLES)
+                    options["max_fallbacks"] = max_fallbacks
+                    engine = BatchedTranscriber(model, BatchedTranscriber.batch_size_for(model_name), options)
+                    result = engine.transcribe_independent([mel], speech=[speech] if speech else None)[0]
+                elif (
+                    # Speculation works on the PyTorch decoder's internals
+                    speculative in SPECULATIVE_DRAFTS and compute_mode != "onnx"
+                    and model_name in self.AVAILABLE_MODELS
+                    and self.AVAILABLE_MODELS.index(speculative) < self.AVAILABLE_MODELS.index(model_name)
+                ):
+                    result, speculation, limiter = self._transcribe_speculative(
+                        model, speculative, compute_mode, audio, mel, decoded, options, max_fallbacks
+                    )
+                else:
+                    limiter = FallbackLimiter(model, max_fallbacks)
+                    model.decode = limiter.decode
+                    try:
+                        with precomputed_mel(mel):
+                            result = model.transcribe(audio, **options)
+                    finally:
+                        del model.decode
+                elapsed = time.perf_counter() - start_time
+            key = self._model_key(model_name, compute_mode)
+            self._record_latency(key, elapsed)
             
             # Format result
             transcription = result.get("text", "")
@@ -103,9 +3248,47 @@ class LocalWhisperGUI:
             output = f"**Transcription:**\n{transcription}\n\n"
             output += f"**Detected Language:** {detected_language}\n"
             output += f"**Model Used:** {model_name}\n"
+            output += f"**Backend:** {backend_label(compute_mode)}\n"
+            if compute_mode == "int8":
+                output += "**Compute Mode:** int8 quantized CPU\n"
+                output += self._quantization_details(model_name)
             
             if result.get("segments"):
                 output += f"**Duration:** {result['segments'][-1]['end']:.2f} seconds\n"
+            if decoded is not None:
+                output += (
+                    f"**Decode:** {decoded['decoder']} in {decoded['decode_s']:.2f}s "
+                    f"({self.audio_loader.fast_path_summary()})\n"
+                )
+                if self.audio_loader.cache_max_bytes > 0:
+                    output += f"**PCM Cache:** {self.audio_loader.cache_summary()}\n"
+            if prepared["mel_hit"] is not None:
+                output += f"**Mel Cache:** {'hit' if prepared['mel_hit'] else 'miss'}, {self.mel_cache.summary()}\n"
+            if speech:
+                duration = len(audio) / self.sample_rate
+                speech_seconds = sum(end - start for start, end in speech)
+                windows = _encoder_windows(duration)
+                speech_windows = sum(_encoder_windows(end - start) for start, end in speech)
+                output += (
+                    f"**Voice Activity:** speech {speech_seconds / duration:.0%} of {duration:.1f}s "
+                    f"({len(speech)} regions), about {max(windows - speech_windows, 0)} of {windows} "
+                    f"30s windows skipped\n"
+                )
+            if language_id is not None:
+                output += f"**Language ID:** {language_id}\n"
+            if speculation is not None:
+                output += f"**Speculative Decoding:** draft {speculative}, {speculation.summary()}\n"
+            if profile is not None:
+                output += f"**Profile:** {profile}\n"
+            if engine is not None:
+                output += (
+                    f"**Independent Windows:** {engine.windows} windows in {engine.batches} "
+                    f"passes of up to {engine.batch_size}\n"
+                )
+                output += f"**Fallbacks:** {result['fallbacks']} window re-decode(s) at higher temperature\n"
+            else:
+                output += f"**Fallbacks:** {limiter.summary()}\n"
+            output += self._latency_details(key, elapsed)
             
             return transcription, output
             
@@ -113,36 +3296,744 @@ class LocalWhisperGUI:
             error_msg = f"❌ Transcription error: {str(e)}"
             return "", error_msg
     
-    def transcribe_multiple_files(self, audio_files, language=None, model_name="base"):
+    def _uses_language_id(self, model_name):
+        """Whether the language-ID model is smaller than the given model"""
+        models = self.AVAILABLE_MODELS
+        return (
+            LANGUAGE_ID_MODEL in models
+            and model_name in models
+            and models.index(LANGUAGE_ID_MODEL) < models.index(model_name)
+        )
+    
+    def identify_language(self, audio, audio_hash=None, compute_mode="float32", start=0):
+        """Identify the spoken language with the small language-ID model
+        
+        Only the 30 seconds from start are used, and results are cached by
+        audio content, so re-transcribing a file (or transcribing it with
+        another model) does not detect its language again. The ID model
+        always runs on PyTorch (int8 on the CPU for the ONNX backend, which
+        would otherwise need it exported too); if it cannot be loaded, None
+        is returned and the caller detects the language with its own model.
+        
+        Args:
+            audio (np.ndarray): 16 kHz mono float32 samples
+            audio_hash (str): Content hash for caching, or None
+            compute_mode (str): Compute mode of the transcribing model
+            start (int): First sample to listen to
+            
+        Returns:
+            tuple: (language code or None, cache_hit)
+        """
+        key = (audio_hash, start)
+        if audio_hash is not None:
+            with self._language_lock:
+                language = self.language_cache.get(key)
+                if language is not None:
+                    self.language_cache.move_to_end(key)
+                    return language, True
+        
+        try:
+            with self.lease_model(LANGUAGE_ID_MODEL, "int8" if compute_mode == "onnx" else compute_mode) as model:
+                window = whisper.pad_or_trim(np.ascontiguousarray(audio[start:start + whisper.audio.N_SAMPLES]))
+                mel = whisper.log_mel_spectrogram(window, model.dims.n_mels)
+                _, probs = model.detect_language(mel.to(model.device))
+        except Exception as e:
+            print(f"Language ID with '{LANGUAGE_ID_MODEL}' failed, using the selected model: {e}")
+            return None, False
+        language = max(probs, key=probs.get)
+        
+        if audio_hash is not None:
+            with self._language_lock:
+                self.language_cache[key] = language
+                while len(self.language_cache) > LANGUAGE_ID_CACHE_SIZE:
+                    self.language_cache.popitem(last=False)
+        return language, False
+    
+    def _transcribe_speculative(self, model, draft_name, compute_mode, audio, mel, decoded, options,
+                                max_fallbacks=None):
+        """Run model.transcribe() with speculative greedy decoding
+        
+        Args:
+            model (whisper.model.Whisper): Leased model to transcribe with
+            draft_name (str): Name of the draft model
+            compute_mode (str): "float32" or "int8"
+            audio (np.ndarray): 16 kHz mono float32 samples
+            mel (torch.Tensor): Precomputed spectrogram for the model, or None
+            decoded (dict): AudioLoader.load() result, or None
+            options (dict): Options for model.transcribe()
+            max_fallbacks (int): Temperature fallbacks allowed, or None
+            
+        Returns:
+            tuple: (transcribe() result, SpeculativeDecoder, FallbackLimiter)
+        """
+        padding = whisper.audio.N_SAMPLES
+        if mel is None:
+            mel = whisper.log_mel_spectrogram(audio, model.dims.n_mels, padding=padding)
+        
+        # whisper would pad the wrapped spectrogram to detect the language
+        if "language" not in options and model.is_multilingual:
+            dtype = torch.float16 if options["fp16"] else torch.float32
+            first_window = whisper.pad_or_trim(mel[:, :whisper.audio.N_FRAMES], whisper.audio.N_FRAMES)
+            _, probs = model.detect_language(first_window.to(model.device).to(dtype))
+            options["language"] = max(probs, key=probs.get)
+        
+        with self.lease_model(draft_name, compute_mode) as draft:
+            n_mels = draft.dims.n_mels
+            if n_mels == model.dims.n_mels:
+                draft_mel = mel
+            elif decoded is not None and self.mel_cache.max_bytes > 0:
+                draft_mel, _ = self.mel_cache.get(decoded["hash"], audio, n_mels)
+            else:
+                draft_mel = whisper.log_mel_spectrogram(audio, n_mels, padding=padding)
+            
+            recorder = _SliceRecorder(mel)
+            speculation = SpeculativeDecoder(model, draft, draft_mel, recorder)
+            model.decode = speculation.decode
+            limiter = FallbackLimiter(model, max_fallbacks)
+            model.decode = limiter.decode
+            try:
+                with precomputed_mel(recorder):
+                    result = model.transcribe(audio, **options)
+            finally:
+                del model.decode
+        return result, speculation, limiter
+    
+    def prepare_audio(self, audio_path, model_name="base", compute_mode="float32", vad=False, featurize=False):
+        """Decode and featurize audio ahead of transcription
+        
+        This is the CPU and I/O side of a transcription, which does not need
+        the model lease, so batches can run it for upcoming files while the
+        current one is being transcribed.
+        
+        Args:
+            audio_path (str or np.ndarray): Path to the audio file, or samples
+            model_name (str): Model the audio will be transcribed with
+            compute_mode (str): "float32" or "int8"
+            vad (bool): Also run voice activity detection
+            featurize (bool): Compute the spectrogram even when the mel cache
+                is disabled
+            
+        Returns:
+            dict: "decoded" (AudioLoader.load() result or None), "audio",
+                "mel" (or None to let whisper compute it), "mel_hit" (None
+                when the mel cache was not used), "speech" (regions or None)
+                and "prepare_s"
+        """
+        start_time = time.perf_counter()
+        decoded = None
+        if isinstance(audio_path, (str, os.PathLike)):
+            decoded = self.audio_loader.load(audio_path)
+            audio = decoded["audio"]
+        else:
+            audio = audio_path
+        
+        # Reuse the spectrogram of audio seen before with the same mel bins
+        mel = None
+        mel_hit = None
+        if decoded is not None and (featurize or self.mel_cache.max_bytes > 0):
+            n_mels = self._request_model(model_name, compute_mode).result().dims.n_mels
+            if self.mel_cache.max_bytes > 0:
+                mel, mel_hit = self.mel_cache.get(decoded["hash"], audio, n_mels)
+            else:
+                mel = whisper.log_mel_spectrogram(audio, n_mels, padding=whisper.audio.N_SAMPLES)
+        
+        speech = detect_speech(audio, self.sample_rate) if vad else None
+        
+        return {
+            "decoded": decoded,
+            "audio": audio,
+            "mel": mel,
+            "mel_hit": mel_hit,
+            "speech": speech,
+            "prepare_s": time.perf_counter() - start_time,
+        }
+    
+    def _span_source(self, audio_path, decoded):
+        """Choose the file that workers slice a long file's samples from
+        
+        Workers map a fast-path WAV directly. Other input gets a .npy of its
+        samples owned by the job: a hard link to the PCM cache entry, which
+        stays readable if the cache evicts the entry meanwhile, or else a
+        copy written once, so that no worker decodes the whole file again.
+        
+        Args:
+            audio_path (str): Path to the audio file
+            decoded (dict): AudioLoader.load() result for the file
+        
+        Returns:
+            tuple: (path to hand to _span_audio(), temporary file to remove or None)
+        """
+        if decoded["decoder"] == "wav":
+            return audio_path, None
+        
+        # Not named *.npy, so that cache eviction leaves it alone
+        link_path = f"{self.audio_loader._cache_path(decoded['hash'])}.{os.getpid()}.{threading.get_ident()}.span"
+        try:
+            os.link(self.audio_loader._cache_path(decoded["hash"]), link_path)
+            return link_path, link_path
+        except OSError:
+            pass  # Not cached, or the cache is on another file system
+        
+        fd, temp_path = tempfile.mkstemp(suffix=".npy")
+        with os.fdopen(fd, "wb") as f:
+            np.save(f, decoded["audio"])
+        return temp_path, temp_path
+    
+    def _span_audio(self, audio_path, audio_hash, start, end):
+        """Read samples [start, end) of a file, without decoding all of it if possible"""
+        with open(audio_path, "rb") as f:
+            magic = f.read(6)
+        if magic == b"\x93NUMPY":
+            # From _span_source(); already float32
+            return np.load(audio_path, mmap_mode="c")[start:end]
+        
+        data = self.audio_loader._map_wav(audio_path)
+        if data is not None:
+            return self.audio_loader._wav_to_float32(data[start:end])
+        
+        audio = self.audio_loader._cache_read(audio_hash) if self.audio_loader.cache_max_bytes > 0 else None
+        if audio is None:
+            audio = self.audio_loader.load(audio_path)["audio"]
+        return audio[start:end]
+    
+    def transcribe_span(self, audio_path, audio_hash, start, end, options, model_name="base",
+                        compute_mode="float32", max_fallbacks=None):
+        """Transcribe samples [start, end) of a file
+        
+        Used by replica workers in parallel long-file mode. The samples are
+        sliced from the memory-mapped WAV file or .npy chosen by the main
+        process (see _span_source()), so only the span itself is read and
+        converted, and nothing is decoded or copied between processes.
+        
+        Args:
+            audio_path (str): Path to the audio file (or its samples .npy)
+            audio_hash (str): Content hash of the file
+            start (int): First sample
+            end (int): One past the last sample
+            options (dict): Options for model.transcribe()
+            model_name (str): Model name to use for transcription
+            compute_mode (str): "float32" or "int8"
+            max_fallbacks (int): Temperature fallbacks allowed, or None
+            
+        Returns:
+            dict: "segments" ((start, end, text) in seconds from the start
+                of the span), "language", "fallbacks" and "elapsed"
+        """
+        audio = self._span_audio(audio_path, audio_hash, start, end)
+        with self.lease_model(model_name, compute_mode) as model:
+            start_time = time.perf_counter()
+            limiter = FallbackLimiter(model, max_fallbacks)
+            model.decode = limiter.decode
+            try:
+                result = model.transcribe(audio, **options)
+            finally:
+                del model.decode
+            elapsed = time.perf_counter() - start_time
+        return {
+            "segments": [(seg["start"], seg["end"], seg["text"]) for seg in result["segments"]],
+            "language": result.get("language"),
+            "fallbacks": limiter.fallbacks,
+            "elapsed": elapsed,
+        }
+    
+    def detect_language_span(self, audio_path, audio_hash, start, model_name="base", compute_mode="float32"):
+        """Detect the language of the 30 seconds of a file from sample start
+        
+        Returns:
+            str: Language code (None for English-only models)
+        """
+        audio = self._span_audio(audio_path, audio_hash, start, start + whisper.audio.N_SAMPLES)
+        with self.lease_model(model_name, compute_mode) as model:
+            if not model.is_multilingual:
+                return None
+            mel = whisper.log_mel_spectrogram(whisper.pad_or_trim(np.ascontiguousarray(audio)), model.dims.n_mels)
+            _, probs = model.detect_language(mel.to(model.device))
+        return max(probs, key=probs.get)
+    
+    def _transcribe_parallel(self, audio_path, language, model_name, compute_mode, chunk_seconds, profile=None):
+        """Transcribe one long file as parallel chunks on worker processes
+        
+        The file is split at silences and each chunk is extended by
+        CHUNK_OVERLAP seconds on both sides, so words at a cut are heard in
+        full. Of the overlapping segments, each chunk keeps those whose
+        midpoint lies in its own part of the file. A profile's fallback cap
+        applies to each chunk.
+        
+        Returns:
+            tuple: (transcription_text, details_text)
+        """
+        decoded = self.audio_loader.load(audio_path)
+        audio = decoded["audio"]
+        chunks = split_at_silence(audio, self.sample_rate, chunk_seconds)
+        if len(chunks) == 1:
+            return self.transcribe_audio(audio_path, language, model_name, compute_mode, profile=profile)
+        
+        options = {"task": "transcribe", "fp16": self._model_key(model_name, compute_mode)[1] == "cuda"}
+        decoding, max_fallbacks = profile_options(profile)
+        options.update(decoding)
+        
+        workers = DEFAULT_CHUNK_WORKERS or max(1, len(_available_cores()) // 4)
+        pool = self._replica_pool_for(
+            model_name, compute_mode, fallback_replicas=min(workers, len(chunks)), lease=True
+        )
+        start_time = time.perf_counter()
+        temp_path = None
+        try:
+            source, temp_path = self._span_source(audio_path, decoded)
+            
+            # All chunks must agree on the language; detect it once from the
+            # first 30 s with speech
+            if language and language != "Auto-detect":
+                options["language"] = language
+            else:
+                speech = detect_speech(audio[:10 * 60 * self.sample_rate], self.sample_rate)
+                first = int(speech[0][0] * self.sample_rate) if speech else 0
+                detected = None
+                if self._uses_language_id(model_name):
+                    detected, _ = self.identify_language(audio, decoded["hash"], compute_mode, first)
+                if detected is None:
+                    detected = pool.submit(
+                        _replica_detect_language, source, decoded["hash"], first, model_name, compute_mode
+                    ).result()
+                if detected:
+                    options["language"] = detected
+            
+            overlap = int(CHUNK_OVERLAP * self.sample_rate)
+            futures = []
+            for start, end in chunks:
+                span_start, span_end = max(start - overlap, 0), min(end + overlap, len(audio))
+                futures.append(pool.submit(
+                    _replica_transcribe_span, source, decoded["hash"], span_start, span_end, options,
+                    model_name, compute_mode, max_fallbacks
+                ))
+            
+            # Stitch the segments back onto the file's timeline
+            segments = []
+            chunk_seconds_total = 0.0
+            fallbacks = 0
+            for (start, end), future in zip(chunks, futures):
+                span = future.result()
+                chunk_seconds_total += span["elapsed"]
+                fallbacks += span["fallbacks"]
+                offset = max(start - overlap, 0) / self.sample_rate
+                for seg_start, seg_end, text in span["segments"]:
+                    seg_start, seg_end = seg_start + offset, seg_end + offset
+                    midpoint = (seg_start + seg_end) / 2 * self.sample_rate
+                    if start <= midpoint < end or (midpoint >= end and end == len(audio)):
+                        segments.append((seg_start, seg_end, text))
+        finally:
+            if temp_path is not None:
+                os.remove(temp_path)
+            self._release_replica_pool(pool)
+        elapsed = time.perf_counter() - start_time
+        
+        transcription = "".join(text for _, _, text in segments)
+        output = f"**Transcription:**\n{transcription}\n\n"
+        output += f"**Detected Language:** {options.get('language', 'en')}\n"
+        output += f"**Model Used:** {model_name}\n"
+        output += f"**Backend:** {backend_label(compute_mode)}\n"
+        if compute_mode == "int8":
+            output += "**Compute Mode:** int8 quantized CPU\n"
+        output += f"**Duration:** {len(audio) / self.sample_rate:.2f} seconds\n"
+        output += f"**Decode:** {decoded['decoder']} in {decoded['decode_s']:.2f}s\n"
+        output += (
+            f"**Parallel:** {len(chunks)} chunks of ~{chunk_seconds:.0f}s on {pool.replicas} workers, "
+            f"{elapsed:.2f}s wall for {chunk_seconds_total:.2f}s of chunk transcription "
+            f"({chunk_seconds_total / elapsed if elapsed > 0 else 0:.1f}x)\n"
+        )
+        if profile is not None:
+            output += f"**Profile:** {profile}\n"
+        output += f"**Fallbacks:** {fallbacks} re-decode(s) at higher temperature\n"
+        
+        return transcription, output
+    
+    def _transcribe_streaming(self, audio_path, options, model_name, compute_mode, on_segment=None,
+                              profile=None):
+        """Transcribe a file from a StreamingMel, without holding all of it in memory
+        
+        Args:
+            audio_path (str): Path to the audio file
+            options (dict): Options for model.transcribe()
+            model_name (str): Model name to use for transcription
+            compute_mode (str): "float32" or "int8"
+            on_segment (callable): Optional callback for finalized segments
+            profile (str): Performance profile already applied to options;
+                its fallback cap is enforced here
+            
+        Returns:
+            tuple: (transcription_text, details_text)
+        """
+        n_mels = self._request_model(model_name, compute_mode).result().dims.n_mels
+        scan_start = time.perf_counter()
+        stream = StreamingMel(lambda: self.audio_loader.stream(audio_path), n_mels)
+        scan_s = time.perf_counter() - scan_start
+        
+        # Identify the language from the first streamed block; the file is
+        # never hashed in this mode, so the result is not cached
+        language_id = None
+        if "language" not in options and self._uses_language_id(model_name):
+            blocks = self.audio_loader.stream(audio_path)
+            try:
+                head = next(blocks, np.zeros(0, dtype=np.float32))
+            finally:
+                blocks.close()
+            detected, _ = self.identify_language(head, compute_mode=compute_mode)
+            if detected:
+                options["language"] = detected
+                language_id = f"{detected} by {LANGUAGE_ID_MODEL}"
+        
+        with self.lease_model(model_name, compute_mode) as model:
+            start_time = time.perf_counter()
+            
+            # whisper.transcribe would pad the whole spectrogram to detect the
+            # language, so detect it here from the first window instead
+            if "language" not in options and model.is_multilingual:
+                dtype = torch.float16 if options["fp16"] else torch.float32
+                first_window = whisper.pad_or_trim(stream.window(0, whisper.audio.N_FRAMES), whisper.audio.N_FRAMES)
+                _, probs = model.detect_language(first_window.to(model.device).to(dtype))
+                options["language"] = max(probs, key=probs.get)
+            
+            emitter = None
+            if on_segment is not None:
+                emitter = StreamingSegmentEmitter(model, stream, on_segment)
+                model.decode = emitter.decode
+            limiter = FallbackLimiter(model, profile_options(profile)[1])
+            model.decode = limiter.decode
+            try:
+                with precomputed_mel(stream):
+                    result = model.transcribe(stream.placeholder, **options)
+            finally:
+                del model.decode
+            if emitter is not None:
+                emitter.flush()
+            elapsed = time.perf_counter() - start_time
+        key = self._model_key(model_name, compute_mode)
+        self._record_latency(key, elapsed)
+        
+        transcription = result.get("text", "")
+        audio_seconds = stream.num_samples / self.sample_rate
+        
+        output = f"**Transcription:**\n{transcription}\n\n"
+        output += f"**Detected Language:** {result.get('language', 'unknown')}\n"
+        output += f"**Model Used:** {model_name}\n"
+        output += f"**Backend:** {backend_label(compute_mode)}\n"
+        if compute_mode == "int8":
+            output += "**Compute Mode:** int8 quantized CPU\n"
+            output += self._quantization_details(model_name)
+        output += f"**Duration:** {audio_seconds:.2f} seconds\n"
+        output += (
+            f"**Streaming:** {stream.windows_computed} windows, "
+            f"peak audio buffer {_format_bytes(stream.peak_buffer_bytes)}, "
+            f"scan pass {scan_s:.2f}s\n"
+        )
+        if language_id is not None:
+            output += f"**Language ID:** {language_id}\n"
+        if profile is not None:
+            output += f"**Profile:** {profile}\n"
+        output += f"**Fallbacks:** {limiter.summary()}\n"
+        output += self._latency_details(key, elapsed)
+        
+        return transcription, output
+    
+    def transcribe_multiple_files(self, audio_files, language=None, model_name="base", compute_mode="float32",
+                                  progress=None, streaming=False, vad=False, stats=None, batched=False,
+                                  speculative=None, detect_once=False, profile=None, independent=False):
         """Transcribe multiple audio files
         
+        Files with identical content are transcribed once and the result is
+        reported under each of their names. Files are spread across the
+        replica pool when one is configured. Otherwise they are transcribed
+        one after another, with up to prefetch_depth upcoming files decoded
+        and featurized on worker threads while the model works on the
+        current one.
+        
         Args:
             audio_files (list): List of audio file paths
             language (str): Language code or None for auto-detection
             model_name (str): Model name to use for transcription
+            compute_mode (str): "float32" or "int8"
+            progress (callable): Optional progress(fraction, desc=...) callback
+            streaming (bool): Transcribe each file in bounded-memory streaming mode
+            vad (bool): Skip long silences in each file
+            stats (dict): Optional dict that receives batch statistics
+                and the files that failed (see pipeline_summary())
+            batched (bool): Transcribe all files together with
+                BatchedTranscriber instead of one after another (in this
+                process only; ignores streaming, vad and word timestamps)
+            speculative (str): Draft model for speculative decoding, or None
+            detect_once (bool): In auto-detect mode, identify the language of
+                the first file and transcribe every file in that language
+            profile (str): Key of PERFORMANCE_PROFILES, or None
+            independent (bool): Decode fixed 30 s windows independently (see
+                transcribe_audio())
             
         Returns:
-            list: List of transcription results
+            list: List of transcription results (files that failed or
+                have no speech are left out)
         """
-        results = []
+        # Identical uploads share one transcription
+        all_files = audio_files
+        file_keys = []
+        unique = {}
+        for audio_path in all_files:
+            try:
+                key = self.audio_loader.file_hash(audio_path)
+            except OSError:
+                key = audio_path  # Unreadable; let transcription report the error
+            file_keys.append(key)
+            unique.setdefault(key, audio_path)
+        audio_files = list(unique.values())
+        outcomes = {}
+        
+        # One language for the whole batch, heard from the first readable file
+        if detect_once and audio_files and (not language or language == "Auto-detect"):
+            for audio_path in audio_files:
+                try:
+                    decoded = self.audio_loader.load(audio_path)
+                except Exception:
+                    continue
+                speech = detect_speech(decoded["audio"][:10 * 60 * self.sample_rate], self.sample_rate) if vad else []
+                first = int(speech[0][0] * self.sample_rate) if speech else 0
+                language = None
+                if self._uses_language_id(model_name):
+                    language, _ = self.identify_language(decoded["audio"], decoded["hash"], compute_mode, first)
+                    detected_by = LANGUAGE_ID_MODEL
+                if language is None:
+                    language = self.detect_language_span(audio_path, decoded["hash"], first, model_name, compute_mode)
+                    detected_by = model_name
+                if stats is not None and language:
+                    stats["language"] = (language, detected_by, os.path.basename(audio_path))
+                break
+        
+        pool = self._replica_pool_for(model_name, compute_mode, lease=True)
+        if batched and pool is None:
+            outcomes = self._transcribe_batched(
+                audio_files, language, model_name, compute_mode, progress, profile, independent
+            )
+            audio_files = []  # Nothing left for the sequential loop below
+        elif pool is not None:
+            futures = [
+                pool.submit(
+                    _replica_transcribe, audio_path, language, model_name, compute_mode, streaming, vad,
+                    speculative, profile, independent
+                )
+                for audio_path in audio_files
+            ]
+        
+        # Producer stage: decode and featurize ahead, at most depth files at a time
+        depth = self.prefetch_depth if pool is None and not streaming and not batched else 0
+        prefetcher = ThreadPoolExecutor(max_workers=self.prefetch_workers) if depth > 0 else None
+        prepared = {}
         
-        for i, audio_path in enumerate(audio_files):
-            transcription, details = self.transcribe_audio(audio_path, language, model_name)
+        def prefetch(index):
+            if prefetcher is not None and index < len(audio_files):
+                prepared[index] = prefetcher.submit(
+                    self.prepare_audio, audio_files[index], model_name, compute_mode, vad, True
+                )
+        
+        for index in range(depth):
+            prefetch(index)
+        
+        batch_start = time.perf_counter()
+        prepare_s = infer_s = stall_s = 0.0
+        try:
+            for i, audio_path in enumerate(audio_files):
+                if progress is not None:
+                    progress(i / len(audio_files), desc=f"Transcribing file {i + 1}/{len(audio_files)}")
+                print(f"Processing file {i+1}/{len(audio_files)}: {os.path.basename(audio_path)}")
+                
+                if pool is not None:
+                    try:
+                        transcription, details = futures[i].result()
+                    except Exception as e:
+                        transcription, details = "", f"❌ Transcription error: {str(e)}"
+                elif prefetcher is not None:
+                    # Consumer stage: wait for this file, then top the queue up
+                    wait_start = time.perf_counter()
+                    try:
+                        ready = prepared.pop(i).result()
+                    except Exception as e:
+                        ready = None
+                        transcription, details = "", f"❌ Transcription error: {str(e)}"
+                    stall_s += time.perf_counter() - wait_start
+                    prefetch(i + depth)
+                    
+                    if ready is not None:
+                        prepare_s += ready["prepare_s"]
+                        infer_start = time.perf_counter()
+                        transcription, details = self.transcribe_audio(
+                            audio_path, language, model_name, compute_mode, vad=vad, prepared=ready,
+                            speculative=speculative, profile=profile, independent=independent
+                        )
+                        infer_s += time.perf_counter() - infer_start
+                else:
+                    transcription, details = self.transcribe_audio(
+                        audio_path, language, model_name, compute_mode, streaming=streaming, vad=vad,
+                        speculative=speculative, profile=profile, independent=independent
+                    )
+                outcomes[audio_path] = (transcription, details)
+        finally:
+            if prefetcher is not None:
+                prefetcher.shutdown(wait=False, cancel_futures=True)
+            self._release_replica_pool(pool)
+        
+        results = []
+        failed = []
+        for audio_path, key in zip(all_files, file_keys):
+            transcription, details = outcomes[unique[key]]
             if transcription:
                 results.append({
                     "filename": os.path.basename(audio_path),
                     "transcription": transcription,
                     "details": details
                 })
+            elif details.startswith("❌"):
+                failed.append((os.path.basename(audio_path), details.strip().splitlines()[0]))
+        
+        if stats is not None:
+            stats["duplicates"] = len(all_files) - len(unique)
+            stats["failed"] = failed
+        if stats is not None and prefetcher is not None:
+            stats.update({
+                "files": len(audio_files),
+                "depth": depth,
+                "workers": self.prefetch_workers,
+                "wall_s": time.perf_counter() - batch_start,
+                "prepare_s": prepare_s,
+                "infer_s": infer_s,
+                "stall_s": stall_s,
+            })
         
         return results
     
-    def process_gradio_audio(self, audio_file):
+    def _transcribe_batched(self, audio_files, language, model_name, compute_mode, progress=None, profile=None,
+                            independent=False):
+        """Transcribe files together, batching their windows
+        
+        With independent, files are cut into fixed 30 s windows
+        (BatchedTranscriber.transcribe_independent()).
+        
+        Returns:
+            dict: (transcription_text, details_text) by file path
+        """
+        outcomes = {}
+        
+        # Decode and featurize every file on the prefetch threads
+        with ThreadPoolExecutor(max_workers=self.prefetch_workers) as executor:
+            futures = {
+                audio_path: executor.submit(self.prepare_audio, audio_path, model_name, compute_mode, False, True)
+                for audio_path in audio_files
+            }
+        prepared = {}
+        for audio_path, future in futures.items():
+            try:
+                prepared[audio_path] = future.result()
+            except Exception as e:
+                outcomes[audio_path] = ("", f"❌ Transcription error: {str(e)}")
+        if not prepared:
+            return outcomes
+        
+        options = {"task": "transcribe", "fp16": self._model_key(model_name, compute_mode)[1] == "cuda"}
+        decoding, options["max_fallbacks"] = profile_options(profile)
+        decoding.pop("word_timestamps", None)
+        options.update(decoding)
+        languages = None
+        if language and language != "Auto-detect":
+            options["language"] = language
+        elif self._uses_language_id(model_name):
+            languages = []
+            for ready in prepared.values():
+                detected, _ = self.identify_language(
+                    ready["audio"], ready["decoded"]["hash"], compute_mode
+                )
+                languages.append(detected)
+            if None in languages:
+                languages = None  # Detect with the transcribing model instead
+        
+        batch_size = BatchedTranscriber.batch_size_for(model_name)
+        if progress is not None:
+            progress(0.0, desc=f"Transcribing {len(prepared)} files in batches of {batch_size}")
+        
+        try:
+            with self.lease_model(model_name, compute_mode) as model:
+                engine = BatchedTranscriber(model, batch_size, options)
+                start_time = time.perf_counter()
+                run = engine.transcribe_independent if independent else engine.transcribe
+                results = run(
+                    [ready["mel"] for ready in prepared.values()],
+                    progress=None if progress is None else lambda f: progress(f, desc="Batched transcription"),
+                    languages=languages
+                )
+                elapsed = time.perf_counter() - start_time
+        except Exception as e:
+            outcomes.update({audio_path: ("", f"❌ Transcription error: {str(e)}") for audio_path in prepared})
+            return outcomes
+        
+        batch_line = (
+            f"**Batched:** {len(prepared)} files, {engine.windows} {'independent ' if independent else ''}"
+            f"windows in {engine.batches} "
+            f"passes of up to {batch_size} ({engine.fallbacks} fallback re-decodes), "
+            f"{elapsed:.2f}s for the whole batch\n"
+        )
+        for (audio_path, ready), result in zip(prepared.items(), results):
+            transcription = result["text"]
+            output = f"**Transcription:**\n{transcription}\n\n"
+            output += f"**Detected Language:** {result['language']}\n"
+            output += f"**Model Used:** {model_name}\n"
+            output += f"**Backend:** {backend_label(compute_mode)}\n"
+            if compute_mode == "int8":
+                output += "**Compute Mode:** int8 quantized CPU\n"
+            if result["segments"]:
+                output += f"**Duration:** {result['segments'][-1]['end']:.2f} seconds\n"
+            output += f"**Decode:** {ready['decoded']['decoder']} in {ready['decoded']['decode_s']:.2f}s\n"
+            if languages is not None:
+                output += f"**Language ID:** {result['language']} by {LANGUAGE_ID_MODEL}\n"
+            if profile is not None:
+                output += f"**Profile:** {profile}\n"
+            output += f"**Fallbacks:** {result['fallbacks']} window re-decode(s) at higher temperature\n"
+            output += batch_line
+            outcomes[audio_path] = (transcription, output)
+        
+        return outcomes
+    
+    @staticmethod
+    def pipeline_summary(stats):
+        """Describe failed files, duplicate uploads and how busy each stage of a batch was
+        
+        Args:
+            stats (dict): Statistics filled in by transcribe_multiple_files()
+            
+        Returns:
+            str: Summary lines, or "" if there is nothing to report
+        """
+        summary = ""
+        for filename, error in stats.get("failed", []):
+            summary += f"**Failed:** {filename}: {error}\n"
+        if stats.get("duplicates"):
+            summary += (
+                f"**Duplicates:** {stats['duplicates']} duplicate upload(s) collapsed, "
+                f"transcribed once and reported under each name\n"
+            )
+        if stats.get("language"):
+            language, detected_by, filename = stats["language"]
+            summary += f"**Batch Language:** {language}, identified by {detected_by} from {filename}\n"
+        if stats.get("wall_s", 0) <= 0:
+            return summary
+        wall = stats["wall_s"]
+        return summary + (
+            f"**Pipeline:** prefetch depth {stats['depth']} on {stats['workers']} worker(s), "
+            f"{wall:.2f}s wall | decode+features {stats['prepare_s']:.2f}s "
+            f"({stats['prepare_s'] / (wall * stats['workers']):.0%} of worker time) | "
+            f"inference {stats['infer_s']:.2f}s ({stats['infer_s'] / wall:.0%}) | "
+            f"waiting on decode {stats['stall_s']:.2f}s ({stats['stall_s'] / wall:.0%})\n"
+        )
+    
+    def process_gradio_audio(self, audio_file, model_name="base", compute_mode="float32"):
         """Process audio from Gradio's audio component"""
         if audio_file is None:
             return "", "❌ No audio provided"
         
-        return self.transcribe_audio(audio_file, None, self.model_name)
+        return self.transcribe_audio(audio_file, None, model_name, compute_mode)
     
     def export_transcription(self, transcription, filename="transcription"):
         """Export transcription to text file"""
@@ -217,6 +4108,30 @@ def create_gui():
                     info="Larger models are more accurate but slower. turbo & large-v3 are newer, faster models"
                 )
                 
+                # Compute mode selection
+                compute_mode_dropdown = gr.Dropdown(
+                    choices=list(COMPUTE_MODES.keys()),
+                    value="Standard",
+                    label="Compute Mode",
+                    info="Quantized CPU uses int8 weights: smaller and faster on CPU, slightly less accurate"
+                )
+                
+                # Inference backend
+                backend_dropdown = gr.Dropdown(
+                    choices=list(BACKENDS.keys()),
+                    value="PyTorch",
+                    label="Backend",
+                    info="ONNX Runtime runs exported fp32 graphs on the CPU (export once with --export-onnx MODEL); overrides the compute mode, no word timestamps or speculative decoding"
+                )
+                
+                # Decoding profile
+                profile_dropdown = gr.Dropdown(
+                    choices=list(PERFORMANCE_PROFILES.keys()),
+                    value=DEFAULT_PROFILE,
+                    label="Performance Profile",
+                    info="fastest: greedy, few fallbacks; balanced: greedy, bounded fallbacks; accurate: beam search, word timestamps"
+                )
+                
                 # Language selection
                 language_dropdown = gr.Dropdown(
                     choices=list(app.language_options.keys()),
@@ -224,6 +4139,64 @@ def create_gui():
                     label="Language"
                 )
                 
+                # Streaming mode for long recordings
+                streaming_checkbox = gr.Checkbox(
+                    value=False,
+                    label="Streaming mode",
+                    info="Bounded memory for multi-hour recordings; segments appear as they are transcribed"
+                )
+                
+                # Parallel chunked transcription of one long file
+                with gr.Row():
+                    parallel_checkbox = gr.Checkbox(
+                        value=False,
+                        label="Parallel long-file",
+                        info="Split a single long file at silences and transcribe the chunks on all cores"
+                    )
+                    chunk_seconds_slider = gr.Slider(
+                        minimum=60,
+                        maximum=1800,
+                        value=DEFAULT_CHUNK_SECONDS,
+                        step=30,
+                        label="Chunk length (s)"
+                    )
+                
+                # Speculative decoding with a small draft model
+                speculative_dropdown = gr.Dropdown(
+                    choices=["Off"] + SPECULATIVE_DRAFTS,
+                    value="Off",
+                    label="Speculative Decoding",
+                    info="A small draft model proposes tokens that the selected model verifies; same output, faster decoding for larger models"
+                )
+                
+                # Batched inference across uploaded files
+                batched_checkbox = gr.Checkbox(
+                    value=False,
+                    label="Batched inference (multiple files)",
+                    info="Run windows of several files through the model together; faster for many short files"
+                )
+                
+                # Fixed, independently decoded windows
+                independent_checkbox = gr.Checkbox(
+                    value=False,
+                    label="Independent windows (long files)",
+                    info="Decode fixed 30-second windows in parallel batches without previous-window context; much faster on long files, slightly less accurate at window boundaries"
+                )
+                
+                # Batch-level language identification
+                detect_once_checkbox = gr.Checkbox(
+                    value=False,
+                    label="Detect language once per batch",
+                    info="With Auto-detect, identify the language of the first file and use it for every file"
+                )
+                
+                # Voice activity detection
+                vad_checkbox = gr.Checkbox(
+                    value=False,
+                    label="Skip silence (VAD)",
+                    info="Only transcribe detected speech; faster on sparse audio and avoids text hallucinated into silence"
+                )
+                
                 # Model status
                 model_status = gr.Textbox(
                     label="Model Status",
@@ -234,6 +4207,9 @@ def create_gui():
             with gr.Column(scale=1):
                 # Load model button
                 load_btn = gr.Button("Load Model", variant="primary")
+                
+                # Refreshes the model status while loads run in the background
+                status_timer = gr.Timer(1.0)
         
         # Audio input section
         with gr.Row():
@@ -274,11 +4250,48 @@ def create_gui():
                     clear_output_btn = gr.Button("Clear Output")
         
         # Event handlers
-        def load_model_handler(model_name):
+        def resolve_compute_mode(compute_mode, backend="PyTorch"):
+            """Internal compute mode for the selected compute mode and backend"""
+            return BACKENDS.get(backend) or COMPUTE_MODES[compute_mode]
+        
+        def load_model_handler(model_name, compute_mode, backend="PyTorch"):
             """Handle model loading button click"""
-            return app.load_model(model_name)
+            return app.load_model(model_name, resolve_compute_mode(compute_mode, backend))
+        
+        def model_status_handler(model_name, compute_mode, backend="PyTorch"):
+            """Report the load state of the selected model"""
+            return app.model_status(model_name, resolve_compute_mode(compute_mode, backend))
+        
+        def transcribe_streaming(audio_path, language, model_name, compute_mode, profile=None):
+            """Transcribe one file in streaming mode, yielding partial text
+            
+            The transcription runs in a worker thread; segments it reports
+            are shown as they arrive, followed by the full details.
+            """
+            segments = queue.Queue()
+            worker = ThreadPoolExecutor(max_workers=1)
+            future = worker.submit(
+                app.transcribe_audio, audio_path, language, model_name, compute_mode,
+                streaming=True, on_segment=segments.put, profile=profile
+            )
+            worker.shutdown(wait=False)
+            
+            partial = ""
+            while not (future.done() and segments.empty()):
+                try:
+                    segment = segments.get(timeout=0.5)
+                except queue.Empty:
+                    continue
+                partial += f"[{segment['start']:.2f} → {segment['end']:.2f}] {segment['text'].strip()}\n"
+                yield f"⏳ Transcribing...\n\n{partial}"
+            
+            _, details = future.result()
+            yield f"{details}"
         
-        def transcribe_handler(audio_files, mic_audio, language, model_name, progress=gr.Progress()):
+        def transcribe_handler(audio_files, mic_audio, language, model_name, compute_mode, streaming=False,
+                               vad=False, parallel=False, chunk_seconds=DEFAULT_CHUNK_SECONDS, batched=False,
+                               speculative="Off", detect_once=False, profile=DEFAULT_PROFILE, independent=False,
+                               backend="PyTorch", progress=gr.Progress()):
             """Handle transcription for both file upload and microphone input
             
             Args:
@@ -286,22 +4299,41 @@ def create_gui():
                 mic_audio: Microphone audio path or None
                 language: Selected language
                 model_name: Selected model
+                compute_mode: Selected compute mode label
+                streaming: Whether to use bounded-memory streaming mode
+                vad: Whether to skip silence (ignored in streaming mode)
+                parallel: Whether to transcribe a single file as parallel chunks
+                chunk_seconds: Target chunk length for parallel mode
+                batched: Whether to batch windows across uploaded files
+                speculative: Draft model for speculative decoding, or "Off"
+                detect_once: Whether to detect one language for all uploaded files
+                profile: Performance profile name
+                independent: Whether to decode fixed 30 s windows independently
+                backend: Selected inference backend label
                 progress: Gradio progress tracker
                 
-            Returns:
-                str: Formatted transcription results
+            Yields:
+                str: Formatted transcription results (partial ones in streaming mode)
             """
+            compute_mode = resolve_compute_mode(compute_mode, backend)
+            speculative = None if speculative == "Off" else speculative
+            
             # Handle microphone input first
             if mic_audio is not None:
                 print("Transcribing microphone recording...")
                 progress(0.0, desc="Starting transcription")
-                transcription, details = app.transcribe_audio(mic_audio, language, model_name)
+                _, details = app.transcribe_audio(
+                    mic_audio, language, model_name, compute_mode, vad=vad, speculative=speculative,
+                    profile=profile, independent=independent
+                )
                 progress(1.0, desc="Transcription complete")
-                return f"{details}"
+                yield f"{details}"
+                return
             
             # Handle file input
             if not audio_files:
-                return "❌ Please upload audio files or record audio"
+                yield "❌ Please upload audio files or record audio"
+                return
             
             # Extract file paths from gradio File objects
             audio_paths = [f.name for f in audio_files]
@@ -309,32 +4341,39 @@ def create_gui():
             # Check if it's a single file or multiple files
             if len(audio_paths) == 1:
                 print(f"Transcribing file: {os.path.basename(audio_paths[0])}")
+                if streaming and not parallel:
+                    yield from transcribe_streaming(audio_paths[0], language, model_name, compute_mode, profile)
+                    return
                 progress(0.0, desc="Starting transcription")
-                transcription, details = app.transcribe_audio(audio_paths[0], language, model_name)
+                _, details = app.transcribe_audio(
+                    audio_paths[0], language, model_name, compute_mode, vad=vad, parallel=parallel,
+                    chunk_seconds=chunk_seconds, speculative=speculative, profile=profile,
+                    independent=independent
+                )
                 progress(1.0, desc="Transcription complete")
-                return f"{details}"
+                yield f"{details}"
             else:
                 # Process multiple files with progress
-                results = []
-                for i, audio_path in enumerate(progress.tqdm(audio_paths, desc="Transcribing files")):
-                    print(f"Processing file {i+1}/{len(audio_paths)}: {os.path.basename(audio_path)}")
-                    transcription, details = app.transcribe_audio(audio_path, language, model_name)
-                    if transcription:
-                        results.append({
-                            "filename": os.path.basename(audio_path),
-                            "transcription": transcription,
-                            "details": details
-                        })
+                pipeline_stats = {}
+                results = app.transcribe_multiple_files(
+                    audio_paths, language, model_name, compute_mode, progress=progress, streaming=streaming,
+                    vad=vad, stats=pipeline_stats, batched=batched, speculative=speculative,
+                    detect_once=detect_once, profile=profile, independent=independent
+                )
+                progress(1.0, desc="Transcription complete")
                 
                 # Format results for display
-                output_text = f"✅ Processed {len(results)} files successfully\n\n"
+                output_text = f"✅ Processed {len(results)} files successfully\n"
+                if pipeline_stats.get("failed"):
+                    output_text += f"❌ {len(pipeline_stats['failed'])} file(s) failed\n"
+                output_text += app.pipeline_summary(pipeline_stats) + "\n"
                 
                 for result in results:
                     output_text += f"FILE: {result.get('filename', '')}\n"
                     output_text += f"{result.get('details', '')}\n\n"
                     output_text += "-" * 50 + "\n\n"
                 
-                return output_text
+                yield output_text
         
         def export_handler(transcription_text):
             """Export transcription results to file
@@ -403,14 +4442,23 @@ def create_gui():
         # Connect events
         load_btn.click(
             load_model_handler,
-            inputs=[model_dropdown],
+            inputs=[model_dropdown, compute_mode_dropdown, backend_dropdown],
+            outputs=[model_status]
+        )
+        
+        status_timer.tick(
+            model_status_handler,
+            inputs=[model_dropdown, compute_mode_dropdown, backend_dropdown],
             outputs=[model_status]
         )
         
         # Unified transcribe button
         transcribe_btn.click(
             transcribe_handler,
-            inputs=[audio_files, mic_input, language_dropdown, model_dropdown],
+            inputs=[audio_files, mic_input, language_dropdown, model_dropdown, compute_mode_dropdown,
+                    streaming_checkbox, vad_checkbox, parallel_checkbox, chunk_seconds_slider, batched_checkbox,
+                    speculative_dropdown, detect_once_checkbox, profile_dropdown, independent_checkbox,
+                    backend_dropdown],
             outputs=[transcription_output]
         )
         
@@ -432,18 +4480,75 @@ def create_gui():
             outputs=[transcription_output]
         )
         
-        # Load initial model
+        # Show the state of the model queued at startup
         interface.load(
-            load_model_handler,
-            inputs=[gr.Textbox(value="base", visible=False)],
+            model_status_handler,
+            inputs=[model_dropdown, compute_mode_dropdown, backend_dropdown],
             outputs=[model_status]
         )
     
+    # Allow several users at once; requests for the same model still take
+    # turns on its lease, different models run in parallel
+    interface.queue(default_concurrency_limit=DEFAULT_CONCURRENCY)
+    
     return interface
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local Whisper GUI")
+    parser.add_argument(
+        "--eager-imports",
+        action="store_true",
+        help="Import all heavy dependencies at startup instead of on first use"
+    )
+    parser.add_argument(
+        "--import-report",
+        action="store_true",
+        help="Print how long each heavy dependency took to import"
+    )
+    parser.add_argument(
+        "--calibrate-replicas",
+        metavar="MODEL",
+        help="Measure throughput for different replica counts of MODEL and exit"
+    )
+    parser.add_argument(
+        "--verify-models",
+        nargs="*",
+        metavar="MODEL",
+        help="Re-check the SHA256 of downloaded checkpoints (all models if none given) and exit"
+    )
+    parser.add_argument(
+        "--export-onnx",
+        nargs="*",
+        metavar="MODEL",
+        help="Export models to ONNX for the ONNX Runtime backend (all models if none given) and exit"
+    )
+    args = parser.parse_args()
+    
+    if args.export_onnx is not None:
+        for model_name in args.export_onnx or LocalWhisperGUI.AVAILABLE_MODELS:
+            start_time = time.perf_counter()
+            output_dir = export_onnx(model_name)
+            print(f"✅ Exported '{model_name}' to {output_dir} in {time.perf_counter() - start_time:.1f}s")
+        raise SystemExit(0)
+    
+    if args.verify_models is not None:
+        model_names = args.verify_models or LocalWhisperGUI.AVAILABLE_MODELS
+        for line in CheckpointVerifier().verify(model_names):
+            print(line)
+        raise SystemExit(0)
+    
+    if args.calibrate_replicas:
+        (replicas, threads), _ = calibrate_replicas(args.calibrate_replicas)
+        print(f"Best layout: WHISPER_REPLICAS={replicas} WHISPER_THREADS_PER_REPLICA={threads}")
+        raise SystemExit(0)
+    
+    if args.eager_imports:
+        preload_modules()
+    
     # Create and launch the GUI
     interface = create_gui()
+    if args.import_report:
+        print(import_time_report())
     interface.launch(
         server_name="127.0.0.1",
         server_port=7860,